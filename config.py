@@ -16,8 +16,11 @@ class Config:
     AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
     AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
     AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
+    S3_PRETTY_JSON = os.getenv('S3_PRETTY_JSON', 'false').lower() == 'true'  # Indent JSON written to S3
+    S3_GZIP_JSON = os.getenv('S3_GZIP_JSON', 'true').lower() == 'true'  # Gzip JSON written to S3
     
     # Cache configuration
+    SEARCH_INDEX_CACHE_FILE = os.getenv('SEARCH_INDEX_CACHE_FILE', '')  # Prebuilt search index in S3, used at startup (empty disables)
     CACHE_DURATION = timedelta(minutes=int(os.getenv('CACHE_DURATION_MINUTES', '15')))
     
     # Server configuration
@@ -1,19 +1,26 @@
-from fastapi import FastAPI, HTTPException, Depends, Query, Body
+from fastapi import FastAPI, HTTPException, Depends, Query, Body, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel, Field
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 import secrets
 import requests
 from datetime import datetime, timedelta
+import asyncio
 import logging
 import threading
 import time
 from time import perf_counter
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import authentication modules
 from auth import get_current_user_optional, require_editor_or_admin, require_admin, UserRole
 from endpoints.auth import router as auth_router
@@ -242,6 +249,22 @@ DATA_TYPE_KEYS = {
     "glossary": "terms"
 }
 
+# Resolved on-disk paths for every known data file, built once at startup
+DATA_FILE_PATHS = {file_name: os.path.join('_data', file_name) for file_name in JSON_FILES.values()}
+
+# JSON serializer used for all writes; orjson produces the UTF-8 bytes directly
+if orjson is not None:
+    parse_json_bytes = orjson.loads
+    JSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+
+    def dump_json_bytes(data: Any) -> bytes:
+        return orjson.dumps(data, option=JSON_WRITE_OPTIONS)
+else:
+    parse_json_bytes = json.loads
+
+    def dump_json_bytes(data: Any) -> bytes:
+        return (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
 def fetch_from_github(file_name: str) -> Dict:
     """Fetch data from GitHub raw content."""
     start_time = perf_counter()
@@ -671,6 +694,16 @@ def get_json_file(file_name: str):
     """Get JSON file content with direct file reading or passthrough mode."""
     start_time = perf_counter()
     logger.info(f"Request for {file_name} - Using {'passthrough' if PASSTHROUGH_MODE else 'direct'} mode")
+    
+    # Local files that need no post-processing are returned as stored
+    if TEST_MODE and not PASSTHROUGH_MODE and file_name in JSON_FILES and file_name != 'toolkit':
+        try:
+            content = read_json_bytes(JSON_FILES[file_name])
+            log_performance("get_json_file", start_time)
+            return Response(content=content, media_type="application/json")
+        except HTTPException as e:
+            logger.error(f"Error reading local file {file_name}: {e.detail}")
+    
     result = fetch_from_github(file_name) if PASSTHROUGH_MODE else get_cached_data(file_name)
     
     # Ensure clickCount is initialized for all toolkit components
@@ -777,7 +810,7 @@ async def get_agreements_by_model(model_short_name: str):
         )
 
 @app.post("/api/models")
-async def create_model(request: CreateModelRequest, current_user: dict = Depends(require_editor_or_admin)):
+async def create_model(request: CreateModelRequest, background_tasks: BackgroundTasks, current_user: dict = Depends(require_editor_or_admin)):
     """
     Create a new data model.
     
@@ -837,11 +870,11 @@ async def create_model(request: CreateModelRequest, current_user: dict = Depends
         
         # Save the updated data to local file
         local_file_path = JSON_FILES['models']
-        write_json_file(local_file_path, models_data)
+        await write_json_file_async(local_file_path, models_data)
         logger.info(f"Created new model in local file {local_file_path}")
         
-        # Update search index
-        update_search_index("models", "add", new_model, str(new_id))
+        # Update search index once the response has been sent
+        background_tasks.add_task(update_search_index, "models", "add", new_model, str(new_id))
         
         logger.info(f"Model {request.shortName} created successfully with ID {new_id}")
         
@@ -860,7 +893,7 @@ async def create_model(request: CreateModelRequest, current_user: dict = Depends
         )
 
 @app.delete("/api/models/{short_name}")
-async def delete_model(short_name: str, current_user: dict = Depends(require_editor_or_admin)):
+async def delete_model(short_name: str, background_tasks: BackgroundTasks, current_user: dict = Depends(require_editor_or_admin)):
     """
     Delete a data model by its short name.
     
@@ -880,28 +913,28 @@ async def delete_model(short_name: str, current_user: dict = Depends(require_edi
         models_data = read_json_file(JSON_FILES['models'])
         
         # Find the model to delete
-        model_to_delete = None
-        for model in models_data['models']:
+        model_index = None
+        for i, model in enumerate(models_data['models']):
             if model['shortName'].lower() == short_name.lower():
-                model_to_delete = model
+                model_index = i
                 break
         
-        if not model_to_delete:
+        if model_index is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Model with shortName '{short_name}' not found"
             )
         
-        # Remove the model from the array
-        models_data['models'] = [m for m in models_data['models'] if m['shortName'].lower() != short_name.lower()]
+        # Remove the model from the array in place
+        del models_data['models'][model_index]
         
         # Save the updated data to local file
         local_file_path = JSON_FILES['models']
-        write_json_file(local_file_path, models_data)
+        await write_json_file_async(local_file_path, models_data)
         logger.info(f"Model deleted from local file {local_file_path}")
         
-        # Update search index
-        update_search_index("models", "delete", item_id=short_name)
+        # Update search index once the response has been sent
+        background_tasks.add_task(update_search_index, "models", "delete", item_id=short_name)
         
         logger.info(f"Model {short_name} deleted successfully")
         
@@ -967,7 +1000,7 @@ async def track_model_click(short_name: str):
         
         # Save the updated data to local file
         local_file_path = JSON_FILES['models']
-        write_json_file(local_file_path, models_data)
+        await write_json_file_async(local_file_path, models_data)
         logger.info(f"Updated click count for model {short_name} to {model['meta']['clickCount']}")
         
         return {
@@ -986,7 +1019,7 @@ async def track_model_click(short_name: str):
         )
 
 @app.put("/api/models/{short_name}")
-async def update_model(short_name: str, request: UpdateModelRequest, current_user: dict = Depends(require_editor_or_admin)):
+async def update_model(short_name: str, request: UpdateModelRequest, background_tasks: BackgroundTasks, current_user: dict = Depends(require_editor_or_admin)):
     """
     Update a data model by its short name.
     
@@ -1060,7 +1093,7 @@ async def update_model(short_name: str, request: UpdateModelRequest, current_use
                             logger.info(f"Updated agreement {agreement['id']} modelShortName from '{old_short_name}' to '{new_short_name}'")
                     
                     if agreements_updated:
-                        write_json_file(JSON_FILES['dataAgreements'], agreements_data)
+                        await write_json_file_async(JSON_FILES['dataAgreements'], agreements_data)
                         logger.info(f"Updated agreements file with new modelShortName references")
                     
                 except Exception as e:
@@ -1092,11 +1125,11 @@ async def update_model(short_name: str, request: UpdateModelRequest, current_use
         
         # Save the updated data to local file
         local_file_path = JSON_FILES['models']
-        write_json_file(local_file_path, models_data)
+        await write_json_file_async(local_file_path, models_data)
         logger.info(f"Updated local file {local_file_path}")
         
-        # Update search index
-        update_search_index("models", "update", updated_model, short_name)
+        # Update search index once the response has been sent
+        background_tasks.add_task(update_search_index, "models", "update", updated_model, short_name)
         
         # No cache to clear - always fresh data
         logger.info("No caching - data will be fresh on next request")
@@ -1153,13 +1186,33 @@ def update_json_path(data: Dict, path: str, value: Any) -> Dict:
     
     return data
 
-def read_json_file(file_path: str) -> Dict:
-    try:
+def resolve_data_path(file_path: str) -> str:
+    """Map a data file name to its path under _data/."""
+    data_path = DATA_FILE_PATHS.get(file_path)
+    if data_path is None:
         # Handle both relative and absolute paths
         if file_path.startswith('_data/'):
             data_path = file_path
         else:
             data_path = os.path.join('_data', file_path)
+    return data_path
+
+# Payloads staged for writing but not yet renamed into place, keyed by data path.
+# Reads check these first, so a request never sees a file from before an earlier
+# request's write that is still running on a worker thread.
+pending_writes: Dict[str, bytes] = {}
+pending_writes_lock = threading.Lock()
+
+# Serializes the disk writes for each data file
+file_write_locks: Dict[str, threading.Lock] = {data_path: threading.Lock() for data_path in DATA_FILE_PATHS.values()}
+
+def read_json_file(file_path: str) -> Dict:
+    try:
+        data_path = resolve_data_path(file_path)
+        
+        pending = pending_writes.get(data_path)
+        if pending is not None:
+            return parse_json_bytes(pending)
         
         logger.info(f"Reading JSON file from: {data_path}")
         with open(data_path, 'r', encoding='utf-8') as f:
@@ -1174,40 +1227,108 @@ def read_json_file(file_path: str) -> Dict:
         logger.error(f"Error reading file {data_path}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error reading file {file_path}: {str(e)}")
 
-def write_json_file(file_path: str, data: Dict):
+# Raw file contents served by pass-through GET endpoints, keyed by data path
+# and stored with the file's mtime so edits made outside the API are picked up
+json_bytes_cache: Dict[str, tuple] = {}
+
+def read_json_bytes(file_path: str) -> bytes:
+    """Read a data file as already-encoded JSON, reusing the cached bytes while the file is unchanged."""
     try:
-        # Handle both relative and absolute paths
-        if file_path.startswith('_data/'):
-            data_path = file_path
-        else:
-            data_path = os.path.join('_data', file_path)
+        data_path = resolve_data_path(file_path)
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        pending = pending_writes.get(data_path)
+        if pending is not None:
+            return pending
         
-        logger.info(f"Writing JSON file to: {data_path}")
+        mtime = os.stat(data_path).st_mtime_ns
+        cached = json_bytes_cache.get(data_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         
-        # Write to a temporary file first, then rename (atomic write)
-        temp_path = f"{data_path}.tmp"
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Atomic rename
-        if os.path.exists(data_path):
+        logger.info(f"Reading JSON file from: {data_path}")
+        with open(data_path, 'rb') as f:
+            content = f.read()
+        # Validate once per change so a corrupt file still surfaces as an error
+        parse_json_bytes(content)
+        json_bytes_cache[data_path] = (mtime, content)
+        return content
+    except FileNotFoundError:
+        logger.error(f"File not found: {file_path}")
+        raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON file: {file_path}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Invalid JSON in file {file_path}: {str(e)}")
+    except Exception as e:
+        logger.error(f"Error reading file {file_path}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error reading file {file_path}: {str(e)}")
+
+def stage_json_write(file_path: str, data: Dict) -> tuple:
+    """Serialize data and register it as the pending content of its file."""
+    try:
+        data_path = resolve_data_path(file_path)
+        
+        # Serialize once up front so a failed encode never leaves a partial temp file
+        payload = dump_json_bytes(data)
+        
+        with pending_writes_lock:
+            pending_writes[data_path] = payload
+            if data_path not in file_write_locks:
+                file_write_locks[data_path] = threading.Lock()
+        return data_path, payload
+    except (TypeError, ValueError) as e:
+        logger.error(f"JSON encoding error writing file {file_path}: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error encoding JSON for file {file_path}: {str(e)}")
+
+def flush_json_write(data_path: str, payload: bytes):
+    """Write a staged payload to disk, unless a newer write for the same file has superseded it."""
+    try:
+        with file_write_locks[data_path]:
+            if pending_writes.get(data_path) is not payload:
+                logger.info(f"Skipping superseded write to: {data_path}")
+                return
+            
+            logger.info(f"Writing JSON file to: {data_path}")
+            
+            # Write to a temporary file first, then rename (atomic write)
+            temp_path = f"{data_path}.tmp"
+            try:
+                with open(temp_path, 'wb') as f:
+                    f.write(payload)
+            except FileNotFoundError:
+                # Ensure directory exists
+                os.makedirs(os.path.dirname(data_path), exist_ok=True)
+                with open(temp_path, 'wb') as f:
+                    f.write(payload)
+            
+            # Atomic rename (replaces any existing file)
             os.replace(temp_path, data_path)
-        else:
-            os.rename(temp_path, data_path)
+            json_bytes_cache.pop(data_path, None)
+            
+            with pending_writes_lock:
+                if pending_writes.get(data_path) is payload:
+                    del pending_writes[data_path]
         
         logger.info(f"Successfully wrote to: {data_path}")
-    except json.JSONEncodeError as e:
-        logger.error(f"JSON encoding error writing file {data_path}: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Error encoding JSON for file {file_path}: {str(e)}")
     except Exception as e:
+        with pending_writes_lock:
+            if pending_writes.get(data_path) is payload:
+                del pending_writes[data_path]
         logger.error(f"Error writing file {data_path}: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Error writing file {file_path}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error writing file {data_path}: {str(e)}")
+
+def write_json_file(file_path: str, data: Dict):
+    flush_json_write(*stage_json_write(file_path, data))
+
+async def write_json_file_async(file_path: str, data: Dict):
+    """Write a JSON file without blocking the event loop.
+
+    The data is serialized on the calling task so later reads see it right away;
+    only the disk write runs in a worker thread.
+    """
+    await asyncio.to_thread(flush_json_write, *stage_json_write(file_path, data))
 
 def update_search_index(data_type: str, action: str, item: Dict[str, Any] = None, item_id: str = None):
-    """Update search index after data changes"""
+    """Update search index after data changes (scheduled as a background task by the CRUD endpoints)"""
     try:
         if action == "add" and item:
             search_service.add_document(data_type, item_id or str(item.get('id', '')), item)
@@ -1225,9 +1346,18 @@ def update_search_index(data_type: str, action: str, item: Dict[str, Any] = None
         logger.error(f"Error updating search index: {str(e)}")
         # Don't raise exception here as it shouldn't break the main operation
 
+def is_unchanged(existing: Dict[str, Any], updated: Dict[str, Any]) -> bool:
+    """Check whether an updated record matches the stored one, ignoring lastUpdated."""
+    if len(existing) - ('lastUpdated' in existing) != len(updated) - ('lastUpdated' in updated):
+        return False
+    return all(
+        key == 'lastUpdated' or (key in existing and existing[key] == value)
+        for key, value in updated.items()
+    )
+
 # Agreement Management Endpoints
 @app.post("/api/agreements")
-async def create_agreement(request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
+async def create_agreement(request: Dict[str, Any], background_tasks: BackgroundTasks, current_user: dict = Depends(require_editor_or_admin)):
     """
     Create a new agreement.
     
@@ -1245,7 +1375,7 @@ async def create_agreement(request: Dict[str, Any], current_user: dict = Depends
         agreements_data = read_json_file(JSON_FILES['dataAgreements'])
         
         # Generate automatic ID
-        new_id = generate_next_agreement_id(agreements_data)
+        new_id = generate_next_sequential_id(agreements_data['agreements'], 'agreement-', 'agreement')
         
         # Add lastUpdated timestamp and assign the generated ID
         new_agreement = request.copy()
@@ -1254,10 +1384,10 @@ async def create_agreement(request: Dict[str, Any], current_user: dict = Depends
         
         agreements_data['agreements'].append(new_agreement)
         local_file_path = JSON_FILES['dataAgreements']
-        write_json_file(local_file_path, agreements_data)
+        await write_json_file_async(local_file_path, agreements_data)
         
-        # Update search index
-        update_search_index("dataAgreements", "add", new_agreement, new_id)
+        # Update search index once the response has been sent
+        background_tasks.add_task(update_search_index, "dataAgreements", "add", new_agreement, new_id)
         
         logger.info(f"Created new agreement in local file {local_file_path}")
         logger.info(f"Agreement {new_id} created successfully")
@@ -1272,7 +1402,7 @@ async def create_agreement(request: Dict[str, Any], current_user: dict = Depends
         raise HTTPException(status_code=500, detail=f"Error creating agreement: {str(e)}")
 
 @app.put("/api/agreements/{agreement_id}")
-async def update_agreement(agreement_id: str, request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
+async def update_agreement(agreement_id: str, request: Dict[str, Any], background_tasks: BackgroundTasks, current_user: dict = Depends(require_editor_or_admin)):
     """
     Update an existing agreement.
     
@@ -1303,6 +1433,17 @@ async def update_agreement(agreement_id: str, request: Dict[str, Any], current_u
         # Update the agreement
         updated_agreement = agreement_to_update.copy()
         updated_agreement.update(request)
+        
+        # Skip the write entirely when the submitted data changes nothing
+        if is_unchanged(agreement_to_update, updated_agreement):
+            logger.info(f"Agreement {agreement_id} unchanged, skipping write")
+            return {
+                "message": "Agreement unchanged",
+                "id": agreement_id,
+                "updated": False,
+                "agreement": agreement_to_update
+            }
+        
         updated_agreement['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Replace the old agreement with the updated one
@@ -1313,10 +1454,10 @@ async def update_agreement(agreement_id: str, request: Dict[str, Any], current_u
         agreements_data['agreements'].append(updated_agreement)
         
         local_file_path = JSON_FILES['dataAgreements']
-        write_json_file(local_file_path, agreements_data)
+        await write_json_file_async(local_file_path, agreements_data)
         
-        # Update search index
-        update_search_index("dataAgreements", "update", updated_agreement, agreement_id)
+        # Update search index once the response has been sent
+        background_tasks.add_task(update_search_index, "dataAgreements", "update", updated_agreement, agreement_id)
         
         logger.info(f"Agreement updated in local file {local_file_path}")
         logger.info(f"Agreement {agreement_id} updated successfully")
@@ -1324,14 +1465,15 @@ async def update_agreement(agreement_id: str, request: Dict[str, Any], current_u
         return {
             "message": "Agreement updated successfully",
             "id": agreement_id,
-            "updated": True
+            "updated": True,
+            "agreement": updated_agreement
         }
     except Exception as e:
         logger.error(f"Error updating agreement: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error updating agreement: {str(e)}")
 
 @app.delete("/api/agreements/{agreement_id}")
-async def delete_agreement(agreement_id: str, current_user: dict = Depends(require_editor_or_admin)):
+async def delete_agreement(agreement_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(require_editor_or_admin)):
     """
     Delete an agreement by its ID.
     
@@ -1348,25 +1490,22 @@ async def delete_agreement(agreement_id: str, current_user: dict = Depends(requi
         logger.info(f"Delete request for agreement: {agreement_id}")
         agreements_data = read_json_file(JSON_FILES['dataAgreements'])
         
-        agreement_to_delete = None
-        for agreement in agreements_data['agreements']:
+        agreement_index = None
+        for i, agreement in enumerate(agreements_data['agreements']):
             if agreement['id'].lower() == agreement_id.lower():
-                agreement_to_delete = agreement
+                agreement_index = i
                 break
         
-        if not agreement_to_delete:
+        if agreement_index is None:
             raise HTTPException(status_code=404, detail=f"Agreement with ID '{agreement_id}' not found")
         
-        agreements_data['agreements'] = [
-            a for a in agreements_data['agreements'] 
-            if a['id'].lower() != agreement_id.lower()
-        ]
+        del agreements_data['agreements'][agreement_index]
         
         local_file_path = JSON_FILES['dataAgreements']
-        write_json_file(local_file_path, agreements_data)
+        await write_json_file_async(local_file_path, agreements_data)
         
-        # Update search index
-        update_search_index("dataAgreements", "delete", item_id=agreement_id)
+        # Update search index once the response has been sent
+        background_tasks.add_task(update_search_index, "dataAgreements", "delete", item_id=agreement_id)
         
         logger.info(f"Agreement deleted from local file {local_file_path}")
         logger.info(f"Agreement {agreement_id} deleted successfully")
@@ -1380,53 +1519,46 @@ async def delete_agreement(agreement_id: str, current_user: dict = Depends(requi
         logger.error(f"Error deleting agreement: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error deleting agreement: {str(e)}")
 
-def generate_next_reference_id(reference_data: Dict) -> str:
-    """
-    Generate the next available reference ID with format 'ref-XXX'.
-    
-    Args:
-        reference_data (dict): The current reference data
-        
-    Returns:
-        str: The next available ID
-    """
-    existing_ids = [item['id'] for item in reference_data['items']]
-    max_number = 0
-    
-    for item_id in existing_ids:
-        if item_id.startswith('ref-'):
-            try:
-                number = int(item_id[4:])  # Extract number after 'ref-'
-                max_number = max(max_number, number)
-            except ValueError:
-                continue  # Skip if not a valid number
-    
-    next_number = max_number + 1
-    return f"ref-{next_number:03d}"  # Format as ref-001, ref-002, etc.
+# Last sequential number issued per ID counter in this process
+_sequential_id_counters: Dict[str, int] = {}
 
-def generate_next_agreement_id(agreements_data: Dict) -> str:
+def generate_next_sequential_id(items: List[Dict], prefix: str, counter_key: str,
+                                parse_number: Optional[Callable[[str], int]] = None) -> str:
     """
-    Generate the next available agreement ID with format 'agreement-XXX'.
+    Generate the next available ID with format '<prefix>XXX' (e.g. 'ref-001').
+    
+    The next number is one past the larger of the highest existing ID in items
+    and the last number this process issued for counter_key, so IDs written by
+    other workers or restored into the file are never reissued.
     
     Args:
-        agreements_data (dict): The current agreements data
+        items (list): The records the IDs belong to
+        prefix (str): The ID prefix, including its separator
+        counter_key (str): The name of the in-memory counter
+        parse_number (callable, optional): Extracts the number from an existing ID;
+            defaults to parsing everything after the prefix
         
     Returns:
         str: The next available ID
     """
-    existing_ids = [agreement['id'] for agreement in agreements_data['agreements']]
-    max_number = 0
+    if parse_number is None:
+        prefix_length = len(prefix)
+        parse_number = lambda item_id: int(item_id[prefix_length:])  # Extract number after the prefix
     
-    for item_id in existing_ids:
-        if item_id.startswith('agreement-'):
+    max_number = _sequential_id_counters.get(counter_key, 0)
+    for item in items:
+        item_id = item.get('id')
+        if item_id and item_id.startswith(prefix):
             try:
-                number = int(item_id[10:])  # Extract number after 'agreement-'
-                max_number = max(max_number, number)
-            except ValueError:
+                number = parse_number(item_id)
+            except (ValueError, IndexError):
                 continue  # Skip if not a valid number
+            if number > max_number:
+                max_number = number
     
     next_number = max_number + 1
-    return f"agreement-{next_number:03d}"  # Format as agreement-001, agreement-002, etc.
+    _sequential_id_counters[counter_key] = next_number
+    return f"{prefix}{next_number:03d}"  # Format as ref-001, ref-002, etc.
 
 # Reference Data Management Endpoints
 @app.post("/api/reference")
@@ -1448,7 +1580,7 @@ async def create_reference_item(request: Dict[str, Any], current_user: dict = De
         reference_data = read_json_file(JSON_FILES['reference'])
         
         # Generate automatic ID
-        new_id = generate_next_reference_id(reference_data)
+        new_id = generate_next_sequential_id(reference_data['items'], 'ref-', 'ref')
         
         # Add lastUpdated timestamp and assign the generated ID
         new_item = request.copy()
@@ -1457,7 +1589,7 @@ async def create_reference_item(request: Dict[str, Any], current_user: dict = De
         
         reference_data['items'].append(new_item)
         local_file_path = JSON_FILES['reference']
-        write_json_file(local_file_path, reference_data)
+        await write_json_file_async(local_file_path, reference_data)
         
         logger.info(f"Created new reference item in local file {local_file_path}")
         logger.info(f"Reference item {new_id} created successfully")
@@ -1503,6 +1635,17 @@ async def update_reference_item(item_id: str, request: Dict[str, Any], current_u
         # Update the reference item
         updated_item = item_to_update.copy()
         updated_item.update(request)
+        
+        # Skip the write entirely when the submitted data changes nothing
+        if is_unchanged(item_to_update, updated_item):
+            logger.info(f"Reference item {item_id} unchanged, skipping write")
+            return {
+                "message": "Reference item unchanged",
+                "id": item_id,
+                "updated": False,
+                "item": item_to_update
+            }
+        
         updated_item['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Replace the old item with the updated one
@@ -1513,7 +1656,7 @@ async def update_reference_item(item_id: str, request: Dict[str, Any], current_u
         reference_data['items'].append(updated_item)
         
         local_file_path = JSON_FILES['reference']
-        write_json_file(local_file_path, reference_data)
+        await write_json_file_async(local_file_path, reference_data)
         
         logger.info(f"Reference item updated in local file {local_file_path}")
         logger.info(f"Reference item {item_id} updated successfully")
@@ -1521,7 +1664,8 @@ async def update_reference_item(item_id: str, request: Dict[str, Any], current_u
         return {
             "message": "Reference item updated successfully",
             "id": item_id,
-            "updated": True
+            "updated": True,
+            "item": updated_item
         }
     except Exception as e:
         logger.error(f"Error updating reference item: {str(e)}")
@@ -1545,22 +1689,19 @@ async def delete_reference_item(item_id: str, current_user: dict = Depends(requi
         logger.info(f"Delete request for reference item: {item_id}")
         reference_data = read_json_file(JSON_FILES['reference'])
         
-        item_to_delete = None
-        for item in reference_data['items']:
+        item_index = None
+        for i, item in enumerate(reference_data['items']):
             if item['id'].lower() == item_id.lower():
-                item_to_delete = item
+                item_index = i
                 break
         
-        if not item_to_delete:
+        if item_index is None:
             raise HTTPException(status_code=404, detail=f"Reference item with ID '{item_id}' not found")
         
-        reference_data['items'] = [
-            i for i in reference_data['items'] 
-            if i['id'].lower() != item_id.lower()
-        ]
+        del reference_data['items'][item_index]
         
         local_file_path = JSON_FILES['reference']
-        write_json_file(local_file_path, reference_data)
+        await write_json_file_async(local_file_path, reference_data)
         
         logger.info(f"Reference item deleted from local file {local_file_path}")
         logger.info(f"Reference item {item_id} deleted successfully")
@@ -1623,7 +1764,7 @@ async def create_glossary_term(request: Dict[str, Any], current_user: dict = Dep
         glossary_data['terms'].append(new_term)
         
         local_file_path = JSON_FILES['glossary']
-        write_json_file(local_file_path, glossary_data)
+        await write_json_file_async(local_file_path, glossary_data)
         
         logger.info(f"Created new glossary term in local file {local_file_path}")
         logger.info(f"Glossary term {new_id} created successfully")
@@ -1682,7 +1823,7 @@ async def update_glossary_term(term_id: str, request: Dict[str, Any], current_us
         glossary_data['terms'].append(updated_term)
         
         local_file_path = JSON_FILES['glossary']
-        write_json_file(local_file_path, glossary_data)
+        await write_json_file_async(local_file_path, glossary_data)
         
         logger.info(f"Glossary term updated in local file {local_file_path}")
         logger.info(f"Glossary term {term_id} updated successfully")
@@ -1716,22 +1857,19 @@ async def delete_glossary_term(term_id: str, current_user: dict = Depends(requir
         logger.info(f"Delete request for glossary term: {term_id}")
         glossary_data = read_json_file(JSON_FILES['glossary'])
         
-        term_to_delete = None
-        for term in glossary_data.get('terms', []):
+        term_index = None
+        for i, term in enumerate(glossary_data.get('terms', [])):
             if term.get('id', '').lower() == term_id.lower():
-                term_to_delete = term
+                term_index = i
                 break
         
-        if not term_to_delete:
+        if term_index is None:
             raise HTTPException(status_code=404, detail=f"Glossary term with ID '{term_id}' not found")
         
-        glossary_data['terms'] = [
-            t for t in glossary_data.get('terms', []) 
-            if t.get('id', '').lower() != term_id.lower()
-        ]
+        del glossary_data['terms'][term_index]
         
         local_file_path = JSON_FILES['glossary']
-        write_json_file(local_file_path, glossary_data)
+        await write_json_file_async(local_file_path, glossary_data)
         
         logger.info(f"Glossary term deleted from local file {local_file_path}")
         logger.info(f"Glossary term {term_id} deleted successfully")
@@ -1747,6 +1885,10 @@ async def delete_glossary_term(term_id: str, current_user: dict = Depends(requir
         logger.error(f"Error deleting glossary term: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error deleting glossary term: {str(e)}")
 
+# Field layout of a stored application. New records are built by copying this
+# template, which starts them at their final table size instead of growing it.
+APPLICATION_TEMPLATE = dict.fromkeys(["id", "name", "description", "domains", "link"])
+
 # Applications CRUD endpoints
 @app.post("/api/applications")
 async def create_application(application: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
@@ -1763,7 +1905,8 @@ async def create_application(application: Dict[str, Any], current_user: dict = D
         HTTPException: If creation fails
     """
     try:
-        logger.info(f"Create request for application: {application.get('name', 'Unknown')}")
+        application_get = application.get
+        logger.info(f"Create request for application: {application_get('name', 'Unknown')}")
         applications_data = read_json_file(JSON_FILES['applications'])
         
         # Generate new ID
@@ -1771,18 +1914,17 @@ async def create_application(application: Dict[str, Any], current_user: dict = D
         new_id = max_id + 1
         
         # Create new application with ID
-        new_application = {
-            "id": new_id,
-            "name": application.get('name', ''),
-            "description": application.get('description', ''),
-            "domains": application.get('domains', []),
-            "link": application.get('link', '')
-        }
+        new_application = APPLICATION_TEMPLATE.copy()
+        new_application["id"] = new_id
+        new_application["name"] = application_get('name', '')
+        new_application["description"] = application_get('description', '')
+        new_application["domains"] = application_get('domains', [])
+        new_application["link"] = application_get('link', '')
         
         applications_data['applications'].append(new_application)
         
         local_file_path = JSON_FILES['applications']
-        write_json_file(local_file_path, applications_data)
+        await write_json_file_async(local_file_path, applications_data)
         
         logger.info(f"Application created in local file {local_file_path}")
         logger.info(f"Application {new_id} created successfully")
@@ -1835,7 +1977,7 @@ async def update_application(application_id: int, application: Dict[str, Any], c
         }
         
         local_file_path = JSON_FILES['applications']
-        write_json_file(local_file_path, applications_data)
+        await write_json_file_async(local_file_path, applications_data)
         
         logger.info(f"Application updated in local file {local_file_path}")
         logger.info(f"Application {application_id} updated successfully")
@@ -1867,22 +2009,19 @@ async def delete_application(application_id: int, current_user: dict = Depends(r
         logger.info(f"Delete request for application: {application_id}")
         applications_data = read_json_file(JSON_FILES['applications'])
         
-        app_to_delete = None
-        for app in applications_data['applications']:
+        app_index = None
+        for i, app in enumerate(applications_data['applications']):
             if app['id'] == application_id:
-                app_to_delete = app
+                app_index = i
                 break
         
-        if not app_to_delete:
+        if app_index is None:
             raise HTTPException(status_code=404, detail=f"Application with ID {application_id} not found")
         
-        applications_data['applications'] = [
-            app for app in applications_data['applications'] 
-            if app['id'] != application_id
-        ]
+        del applications_data['applications'][app_index]
         
         local_file_path = JSON_FILES['applications']
-        write_json_file(local_file_path, applications_data)
+        await write_json_file_async(local_file_path, applications_data)
         
         logger.info(f"Application deleted from local file {local_file_path}")
         logger.info(f"Application {application_id} deleted successfully")
@@ -1896,6 +2035,14 @@ async def delete_application(application_id: int, current_user: dict = Depends(r
         logger.error(f"Error deleting application: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error deleting application: {str(e)}")
 
+# Common field layout of a stored toolkit component (type-specific fields are
+# added on top), copied for each new component like APPLICATION_TEMPLATE
+TOOLKIT_COMPONENT_TEMPLATE = dict.fromkeys([
+    "id", "name", "displayName", "description", "type", "category", "tags",
+    "author", "version", "lastUpdated", "usage", "dependencies", "examples",
+    "git", "rating", "downloads", "clickCount"
+])
+
 # Toolkit CRUD endpoints
 @app.post("/api/toolkit")
 async def create_toolkit_component(component: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
@@ -1912,7 +2059,9 @@ async def create_toolkit_component(component: Dict[str, Any], current_user: dict
         HTTPException: If creation fails
     """
     try:
-        logger.info(f"Create request for toolkit component: {component.get('name', 'Unknown')}")
+        component_get = component.get
+        name = component_get('name', '')
+        logger.info(f"Create request for toolkit component: {name or 'Unknown'}")
         logger.debug(f"Component data received: {json.dumps(component, default=str)[:500]}")  # Log first 500 chars
         
         toolkit_data = read_json_file(JSON_FILES['toolkit'])
@@ -1922,7 +2071,7 @@ async def create_toolkit_component(component: Dict[str, Any], current_user: dict
             toolkit_data['toolkit'] = {}
         
         # Determine component type and generate ID
-        component_type = component.get('type', 'functions')
+        component_type = component_get('type', 'functions')
         if component_type not in ['functions', 'containers', 'terraform']:
             raise HTTPException(status_code=400, detail="Invalid component type")
         
@@ -1932,81 +2081,71 @@ async def create_toolkit_component(component: Dict[str, Any], current_user: dict
         
         # For functions, generate a UUID as the ID
         if component_type == 'functions':
-            function_name = component.get('name', '')
-            if not function_name:
+            if not name:
                 raise HTTPException(status_code=400, detail="Function name is required")
             
             # Check if function name already exists (for display purposes, not ID)
             existing_names = [item.get('name', '') for item in toolkit_data['toolkit'][component_type] if item.get('name')]
-            if function_name in existing_names:
-                raise HTTPException(status_code=400, detail=f"Function with name '{function_name}' already exists")
+            if name in existing_names:
+                raise HTTPException(status_code=400, detail=f"Function with name '{name}' already exists")
             
             # Generate UUID for function ID
             new_id = str(uuid.uuid4())
         else:
             # Generate new ID based on type for other component types
-            existing_ids = [item.get('id', '') for item in toolkit_data['toolkit'][component_type] if item.get('id')]
             if component_type == 'containers':
-                prefix = 'cont_'
+                counter_key = 'cont'
             else:
-                prefix = 'tf_'
-            
-            max_num = 0
-            for item_id in existing_ids:
-                if item_id and item_id.startswith(prefix):
-                    try:
-                        num = int(item_id.split('_')[1])
-                        max_num = max(max_num, num)
-                    except (ValueError, IndexError):
-                        pass
-            
-            new_id = f"{prefix}{max_num + 1:03d}"
+                counter_key = 'tf'
+            new_id = generate_next_sequential_id(
+                toolkit_data['toolkit'][component_type], f"{counter_key}_", counter_key,
+                parse_number=lambda item_id: int(item_id.split('_')[1])
+            )
         
         # Create new component with ID
-        new_component = {
-            "id": new_id,
-            "name": component.get('name', ''),
-            "displayName": component.get('displayName', component.get('name', '')),
-            "description": component.get('description', ''),
-            "type": component_type,
-            "category": component.get('category', ''),
-            "tags": component.get('tags', []),
-            "author": component.get('author', ''),
-            "version": component.get('version', '1.0.0'),
-            "lastUpdated": datetime.now().isoformat(),
-            "usage": component.get('usage', ''),
-            "dependencies": component.get('dependencies', []),
-            "examples": component.get('examples', []),
-            "git": component.get('git', ''),
-            "rating": component.get('rating', 5.0),
-            "downloads": 0,
-            "clickCount": 0
-        }
+        new_component = TOOLKIT_COMPONENT_TEMPLATE.copy()
+        new_component["id"] = new_id
+        new_component["name"] = name
+        new_component["displayName"] = component_get('displayName', name)
+        new_component["description"] = component_get('description', '')
+        new_component["type"] = component_type
+        new_component["category"] = component_get('category', '')
+        new_component["tags"] = component_get('tags', [])
+        new_component["author"] = component_get('author', '')
+        new_component["version"] = component_get('version', '1.0.0')
+        new_component["lastUpdated"] = datetime.now().isoformat()
+        new_component["usage"] = component_get('usage', '')
+        new_component["dependencies"] = component_get('dependencies', [])
+        new_component["examples"] = component_get('examples', [])
+        new_component["git"] = component_get('git', '')
+        new_component["rating"] = component_get('rating', 5.0)
+        new_component["downloads"] = 0
+        new_component["clickCount"] = 0
         
         # Add type-specific fields
         if component_type == 'functions':
-            new_component['language'] = component.get('language', 'python')
+            new_component['language'] = component_get('language', 'python')
             # Safely handle code field - ensure it's a string
-            code_value = component.get('code', '')
+            code_value = component_get('code', '')
             new_component['code'] = str(code_value) if code_value is not None else ''
             # Safely handle parameters - ensure it's a list
-            params = component.get('parameters', [])
+            params = component_get('parameters', [])
             new_component['parameters'] = params if isinstance(params, list) else []
         elif component_type == 'containers':
-            new_component['dockerfile'] = component.get('dockerfile', '')
-            new_component['dockerCompose'] = component.get('dockerCompose', '')
+            new_component['dockerfile'] = component_get('dockerfile', '')
+            new_component['dockerCompose'] = component_get('dockerCompose', '')
         elif component_type == 'terraform':
-            new_component['provider'] = component.get('provider', '')
-            new_component['mainTf'] = component.get('mainTf', '')
-            new_component['variablesTf'] = component.get('variablesTf', '')
-            new_component['outputsTf'] = component.get('outputsTf', '')
+            new_component['provider'] = component_get('provider', '')
+            new_component['mainTf'] = component_get('mainTf', '')
+            new_component['variablesTf'] = component_get('variablesTf', '')
+            new_component['outputsTf'] = component_get('outputsTf', '')
         
         toolkit_data['toolkit'][component_type].append(new_component)
         
         logger.debug(f"About to write component with ID: {new_id}, name: {new_component.get('name')}")
         
         local_file_path = JSON_FILES['toolkit']
-        write_json_file(local_file_path, toolkit_data)
+        await write_json_file_async(local_file_path, toolkit_data)
         
         logger.info(f"Toolkit component created in local file {local_file_path}")
         logger.info(f"Component {new_id} created successfully")
@@ -2144,7 +2283,7 @@ async def update_toolkit_package(
         # Save the updated toolkit data
         try:
             local_file_path = JSON_FILES['toolkit']
-            write_json_file(local_file_path, toolkit_data)
+            await write_json_file_async(local_file_path, toolkit_data)
             logger.info(f"Package {package_name} (ID: {package_uuid}) saved successfully")
         except Exception as e:
             logger.error(f"Error writing toolkit file: {str(e)}", exc_info=True)
@@ -2196,21 +2335,23 @@ async def update_toolkit_component(component_type: str, component_id: str, compo
         
         # Update the component
         existing_component = toolkit_data['toolkit'][component_type][comp_to_update]
+        component_get = component.get
+        name = component_get('name', '')
         updated_component = {
             **existing_component,
-            "name": component.get('name', ''),
-            "displayName": component.get('displayName', component.get('name', '')),
-            "description": component.get('description', ''),
-            "category": component.get('category', ''),
-            "tags": component.get('tags', []),
-            "author": component.get('author', ''),
-            "version": component.get('version', '1.0.0'),
+            "name": name,
+            "displayName": component_get('displayName', name),
+            "description": component_get('description', ''),
+            "category": component_get('category', ''),
+            "tags": component_get('tags', []),
+            "author": component_get('author', ''),
+            "version": component_get('version', '1.0.0'),
             "lastUpdated": datetime.now().isoformat(),
-            "usage": component.get('usage', ''),
-            "dependencies": component.get('dependencies', []),
-            "examples": component.get('examples', []),
-            "git": component.get('git', ''),
-            "rating": component.get('rating', 5.0)
+            "usage": component_get('usage', ''),
+            "dependencies": component_get('dependencies', []),
+            "examples": component_get('examples', []),
+            "git": component_get('git', ''),
+            "rating": component_get('rating', 5.0)
         }
         # Preserve clickCount if it exists
         if 'clickCount' in existing_component:
@@ -2218,22 +2359,31 @@ async def update_toolkit_component(component_type: str, component_id: str, compo
         
         # Update type-specific fields
         if component_type == 'functions':
-            updated_component['language'] = component.get('language', '')
-            updated_component['code'] = component.get('code', '')
-            updated_component['parameters'] = component.get('parameters', [])
+            updated_component['language'] = component_get('language', '')
+            updated_component['code'] = component_get('code', '')
+            updated_component['parameters'] = component_get('parameters', [])
         elif component_type == 'containers':
-            updated_component['dockerfile'] = component.get('dockerfile', '')
-            updated_component['dockerCompose'] = component.get('dockerCompose', '')
+            updated_component['dockerfile'] = component_get('dockerfile', '')
+            updated_component['dockerCompose'] = component_get('dockerCompose', '')
         elif component_type == 'terraform':
-            updated_component['provider'] = component.get('provider', '')
-            updated_component['mainTf'] = component.get('mainTf', '')
-            updated_component['variablesTf'] = component.get('variablesTf', '')
-            updated_component['outputsTf'] = component.get('outputsTf', '')
+            updated_component['provider'] = component_get('provider', '')
+            updated_component['mainTf'] = component_get('mainTf', '')
+            updated_component['variablesTf'] = component_get('variablesTf', '')
+            updated_component['outputsTf'] = component_get('outputsTf', '')
+        
+        # Skip the write entirely when the submitted data changes nothing
+        if is_unchanged(existing_component, updated_component):
+            logger.info(f"Component {component_id} unchanged, skipping write")
+            return {
+                "message": "Toolkit component unchanged",
+                "id": component_id,
+                "component": existing_component
+            }
         
         toolkit_data['toolkit'][component_type][comp_to_update] = updated_component
         
         local_file_path = JSON_FILES['toolkit']
-        write_json_file(local_file_path, toolkit_data)
+        await write_json_file_async(local_file_path, toolkit_data)
         
         logger.info(f"Toolkit component updated in local file {local_file_path}")
         logger.info(f"Component {component_id} updated successfully")
@@ -2358,7 +2508,7 @@ async def delete_toolkit_package(
         
         # Save the updated toolkit data
         local_file_path = JSON_FILES['toolkit']
-        write_json_file(local_file_path, toolkit_data)
+        await write_json_file_async(local_file_path, toolkit_data)
         
         logger.info(f"Package {package_to_delete.get('name', 'Unknown')} (ID: {package_id}) deleted successfully")
         
@@ -2397,22 +2547,19 @@ async def delete_toolkit_component(component_type: str, component_id: str, curre
         
         toolkit_data = read_json_file(JSON_FILES['toolkit'])
         
-        comp_to_delete = None
-        for comp in toolkit_data['toolkit'][component_type]:
+        comp_index = None
+        for i, comp in enumerate(toolkit_data['toolkit'][component_type]):
             if comp['id'] == component_id:
-                comp_to_delete = comp
+                comp_index = i
                 break
         
-        if not comp_to_delete:
+        if comp_index is None:
             raise HTTPException(status_code=404, detail=f"Component with ID {component_id} not found")
         
-        toolkit_data['toolkit'][component_type] = [
-            comp for comp in toolkit_data['toolkit'][component_type] 
-            if comp['id'] != component_id
-        ]
+        del toolkit_data['toolkit'][component_type][comp_index]
         
         local_file_path = JSON_FILES['toolkit']
-        write_json_file(local_file_path, toolkit_data)
+        await write_json_file_async(local_file_path, toolkit_data)
         
         logger.info(f"Toolkit component deleted from local file {local_file_path}")
         logger.info(f"Component {component_id} deleted successfully")
@@ -2430,8 +2577,8 @@ async def delete_toolkit_component(component_type: str, component_id: str, curre
 def get_policies():
     """Get all data policies."""
     try:
-        policies_data = read_json_file(JSON_FILES['policies'])
-        return policies_data
+        # Served straight from the stored JSON, no parse/re-encode round trip
+        return Response(content=read_json_bytes(JSON_FILES['policies']), media_type="application/json")
     except Exception as e:
         logger.error(f"Error reading policies: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error reading policies: {str(e)}")
@@ -2487,6 +2634,15 @@ def update_policy(policy_id: str, policy: Dict[str, Any], current_user: dict = D
         if existing_policy is None:
             raise HTTPException(status_code=404, detail=f"Policy with ID {policy_id} not found")
         
+        # Skip the write entirely when the submitted data changes nothing
+        if is_unchanged(policies_data['policies'][existing_policy], policy):
+            logger.info(f"Policy {policy_id} unchanged, skipping write")
+            return {
+                "message": "Policy unchanged",
+                "id": policy_id,
+                "policy": policies_data['policies'][existing_policy]
+            }
+        
         # Update timestamp
         policy['lastUpdated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
@@ -2519,15 +2675,17 @@ def delete_policy(policy_id: str, current_user: dict = Depends(require_editor_or
         policies_data = read_json_file(JSON_FILES['policies'])
         
         # Find and remove policy
-        original_length = len(policies_data['policies'])
-        policies_data['policies'] = [
-            p for p in policies_data['policies'] 
-            if p['id'] != policy_id
-        ]
+        policy_index = None
+        for i, p in enumerate(policies_data['policies']):
+            if p['id'] == policy_id:
+                policy_index = i
+                break
         
-        if len(policies_data['policies']) == original_length:
+        if policy_index is None:
             raise HTTPException(status_code=404, detail=f"Policy with ID {policy_id} not found")
         
+        del policies_data['policies'][policy_index]
+        
         # Write to file
         local_file_path = JSON_FILES['policies']
         write_json_file(local_file_path, policies_data)
@@ -2641,7 +2799,7 @@ async def track_page_view(page: str = Query(..., description="Page path/name to
         stats_data['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Save updated statistics
-        write_json_file(JSON_FILES['statistics'], stats_data)
+        await write_json_file_async(JSON_FILES['statistics'], stats_data)
         
         logger.info(f"Tracked page view for {page} on {today}")
         
@@ -2700,7 +2858,7 @@ async def track_site_visit():
         stats_data['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Save updated statistics
-        write_json_file(JSON_FILES['statistics'], stats_data)
+        await write_json_file_async(JSON_FILES['statistics'], stats_data)
         
         logger.info(f"Tracked site visit on {today}")
         
@@ -2977,7 +3135,7 @@ async def create_rule(request: Dict[str, Any], current_user: dict = Depends(requ
         
         rules_data['rules'].append(new_rule)
         local_file_path = JSON_FILES['rules']
-        write_json_file(local_file_path, rules_data)
+        await write_json_file_async(local_file_path, rules_data)
         
         logger.info(f"Created new rule in local file {local_file_path}")
         logger.info(f"Rule {new_id} created successfully")
@@ -3023,7 +3181,7 @@ async def create_country_rule(request: Dict[str, Any], current_user: dict = Depe
         
         rules_data['rules'].append(new_rule)
         local_file_path = JSON_FILES['countryRules']
-        write_json_file(local_file_path, rules_data)
+        await write_json_file_async(local_file_path, rules_data)
         
         logger.info(f"Created new country rule in local file {local_file_path}")
         logger.info(f"Country rule {new_id} created successfully")
@@ -3076,7 +3234,7 @@ async def update_rule(rule_id: str, request: Dict[str, Any], current_user: dict
         rules_data['rules'][rule_to_update] = updated_rule
         
         local_file_path = JSON_FILES['rules']
-        write_json_file(local_file_path, rules_data)
+        await write_json_file_async(local_file_path, rules_data)
         
         logger.info(f"Rule updated in local file {local_file_path}")
         logger.info(f"Rule {rule_id} updated successfully")
@@ -3131,7 +3289,7 @@ async def update_country_rule(rule_id: str, request: Dict[str, Any], current_use
         rules_data['rules'][rule_to_update] = updated_rule
         
         local_file_path = JSON_FILES['countryRules']
-        write_json_file(local_file_path, rules_data)
+        await write_json_file_async(local_file_path, rules_data)
         
         logger.info(f"Country rule updated in local file {local_file_path}")
         logger.info(f"Country rule {rule_id} updated successfully")
@@ -3178,7 +3336,7 @@ async def delete_rule(rule_id: str, current_user: dict = Depends(require_editor_
         ]
         
         local_file_path = JSON_FILES['rules']
-        write_json_file(local_file_path, rules_data)
+        await write_json_file_async(local_file_path, rules_data)
         
         logger.info(f"Rule deleted from local file {local_file_path}")
         logger.info(f"Rule {rule_id} deleted successfully")
@@ -9,8 +9,28 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# orjson parses bytes and serializes straight to UTF-8 bytes; fall back to the
+# stdlib encoder when it isn't installed
+if orjson is not None:
+    def _parse_json(content: bytes) -> Any:
+        return orjson.loads(content)
+
+    def _serialize_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    def _parse_json(content: bytes) -> Any:
+        return json.loads(content)
+
+    def _serialize_json(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 class S3Service:
     """Service class for handling S3 operations"""
     
@@ -82,9 +102,9 @@ class S3Service:
                 Key=file_path
             )
             
-            # Read and parse JSON content
-            content = response['Body'].read().decode('utf-8')
-            data = json.loads(content)
+            # Read and parse JSON content (parsed from bytes, no separate decode pass)
+            content = response['Body'].read()
+            data = _parse_json(content)
             
             logger.info(f"Successfully read JSON file from S3: {file_path}")
             return data
@@ -129,14 +149,14 @@ class S3Service:
             
             logger.info(f"Writing JSON file to S3: s3://{self.bucket_name}/{file_path}")
             
-            # Convert data to JSON string
-            json_content = json.dumps(data, indent=2, ensure_ascii=False)
+            # Convert data to UTF-8 encoded JSON
+            json_content = _serialize_json(data)
             
             # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=file_path,
-                Body=json_content.encode('utf-8'),
+                Body=json_content,
                 ContentType='application/json'
             )
             
@@ -7,6 +7,7 @@ import logging
 import json
 import os
 import re
+import threading
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -24,6 +25,8 @@ class SearchService:
             'documents_by_type': {}
         }
         self.data_dir = os.path.join(os.path.dirname(__file__), '..', '_data')
+        # Guards index/stats: background tasks update them while searches read them
+        self._index_lock = threading.RLock()
     
     def load_data_file(self, filename: str) -> List[Dict[str, Any]]:
         """Load data from a JSON file."""
@@ -107,8 +110,8 @@ class SearchService:
         """Build the search index from all data sources."""
         try:
             logger.info("Building search index...")
-            self.index = {}
-            self.stats = {
+            index = {}
+            stats = {
                 'total_documents': 0,
                 'total_tokens': 0,
                 'last_updated': datetime.now().isoformat(),
@@ -138,7 +141,7 @@ class SearchService:
                 if not data:
                     continue
                 
-                self.stats['documents_by_type'][doc_type] = 0
+                stats['documents_by_type'][doc_type] = 0
                 
                 for item in data:
                     # Create a unique ID for the document
@@ -154,7 +157,7 @@ class SearchService:
                     
                     # Add to index
                     index_key = f"{doc_type}:{doc_id}"
-                    self.index[index_key] = {
+                    index[index_key] = {
                         '_search_type': doc_type,
                         '_search_id': doc_id,
                         '_search_text': searchable_text,
@@ -163,12 +166,16 @@ class SearchService:
                     
                     total_documents += 1
                     total_tokens += len(searchable_text.split())
-                    self.stats['documents_by_type'][doc_type] += 1
+                    stats['documents_by_type'][doc_type] += 1
                 
-                logger.info(f"Indexed {self.stats['documents_by_type'][doc_type]} {doc_type} documents")
+                logger.info(f"Indexed {stats['documents_by_type'][doc_type]} {doc_type} documents")
             
-            self.stats['total_documents'] = total_documents
-            self.stats['total_tokens'] = total_tokens
+            stats['total_documents'] = total_documents
+            stats['total_tokens'] = total_tokens
+            
+            with self._index_lock:
+                self.index = index
+                self.stats = stats
             
             logger.info(f"Search index built successfully with {total_documents} documents")
             return True
@@ -187,7 +194,8 @@ class SearchService:
             results = []
             
             # Filter by document types if specified
-            search_items = self.index.items()
+            with self._index_lock:
+                search_items = list(self.index.items())
             if doc_types:
                 search_items = [(k, v) for k, v in search_items if v.get('_search_type') in doc_types]
             
@@ -238,23 +246,24 @@ class SearchService:
             if not searchable_text:
                 return False
             
-            index_key = f"{doc_type}:{doc_id}"
-            self.index[index_key] = {
-                '_search_type': doc_type,
-                '_search_id': doc_id,
-                '_search_text': searchable_text,
-                **document
-            }
-            
-            # Update stats
-            self.stats['total_documents'] += 1
-            self.stats['total_tokens'] += len(searchable_text.split())
-            if doc_type not in self.stats['documents_by_type']:
-                self.stats['documents_by_type'][doc_type] = 0
-            self.stats['documents_by_type'][doc_type] += 1
-            
-            logger.info(f"Added document {doc_type}:{doc_id}")
-            return True
+            with self._index_lock:
+                index_key = f"{doc_type}:{doc_id}"
+                self.index[index_key] = {
+                    '_search_type': doc_type,
+                    '_search_id': doc_id,
+                    '_search_text': searchable_text,
+                    **document
+                }
+                
+                # Update stats
+                self.stats['total_documents'] += 1
+                self.stats['total_tokens'] += len(searchable_text.split())
+                if doc_type not in self.stats['documents_by_type']:
+                    self.stats['documents_by_type'][doc_type] = 0
+                self.stats['documents_by_type'][doc_type] += 1
+                
+                logger.info(f"Added document {doc_type}:{doc_id}")
+                return True
         except Exception as e:
             logger.error(f"Error adding document: {e}")
             return False
@@ -266,24 +275,25 @@ class SearchService:
             if not searchable_text:
                 return False
             
-            index_key = f"{doc_type}:{doc_id}"
-            old_item = self.index.get(index_key, {})
-            old_text = old_item.get('_search_text', '')
-            
-            self.index[index_key] = {
-                '_search_type': doc_type,
-                '_search_id': doc_id,
-                '_search_text': searchable_text,
-                **document
-            }
-            
-            # Update token count
-            old_tokens = len(old_text.split()) if old_text else 0
-            new_tokens = len(searchable_text.split())
-            self.stats['total_tokens'] = self.stats['total_tokens'] - old_tokens + new_tokens
-            
-            logger.info(f"Updated document {doc_type}:{doc_id}")
-            return True
+            with self._index_lock:
+                index_key = f"{doc_type}:{doc_id}"
+                old_item = self.index.get(index_key, {})
+                old_text = old_item.get('_search_text', '')
+                
+                self.index[index_key] = {
+                    '_search_type': doc_type,
+                    '_search_id': doc_id,
+                    '_search_text': searchable_text,
+                    **document
+                }
+                
+                # Update token count
+                old_tokens = len(old_text.split()) if old_text else 0
+                new_tokens = len(searchable_text.split())
+                self.stats['total_tokens'] = self.stats['total_tokens'] - old_tokens + new_tokens
+                
+                logger.info(f"Updated document {doc_type}:{doc_id}")
+                return True
         except Exception as e:
             logger.error(f"Error updating document: {e}")
             return False
@@ -291,22 +301,23 @@ class SearchService:
     def remove_document(self, doc_type: str, doc_id: str) -> bool:
         """Remove a document from the search index."""
         try:
-            index_key = f"{doc_type}:{doc_id}"
-            if index_key in self.index:
-                item = self.index[index_key]
-                searchable_text = item.get('_search_text', '')
-                
-                del self.index[index_key]
-                
-                # Update stats
-                self.stats['total_documents'] -= 1
-                self.stats['total_tokens'] -= len(searchable_text.split())
-                if doc_type in self.stats['documents_by_type']:
-                    self.stats['documents_by_type'][doc_type] -= 1
-                
-                logger.info(f"Removed document {doc_type}:{doc_id}")
-                return True
-            return False
+            with self._index_lock:
+                index_key = f"{doc_type}:{doc_id}"
+                if index_key in self.index:
+                    item = self.index[index_key]
+                    searchable_text = item.get('_search_text', '')
+                    
+                    del self.index[index_key]
+                    
+                    # Update stats
+                    self.stats['total_documents'] -= 1
+                    self.stats['total_tokens'] -= len(searchable_text.split())
+                    if doc_type in self.stats['documents_by_type']:
+                        self.stats['documents_by_type'][doc_type] -= 1
+                    
+                    logger.info(f"Removed document {doc_type}:{doc_id}")
+                    return True
+                return False
         except Exception as e:
             logger.error(f"Error removing document: {e}")
             return False
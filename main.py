@@ -3,7 +3,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import asyncio
+import functools
 import logging
+from contextlib import AsyncExitStack
 from time import perf_counter
 import uuid
 
@@ -11,7 +14,7 @@ import uuid
 from auth import get_current_user_optional, require_editor_or_admin, require_admin, UserRole
 from endpoints.auth import router as auth_router
 from services.search_service import search_service
-from services.data_service import DataService
+from services.data_service import get_data_service
 from services.python_introspection_service import python_introspection_service
 from config import Config
 
@@ -43,8 +46,9 @@ def get_performance_stats():
         "total_requests": performance_metrics["requests"]["total"],
         "requests_by_endpoint": performance_metrics["requests"]["by_endpoint"],
         "cache": {
-            "status": "disabled",
-            "message": "All data is read fresh from files"
+            "status": "etag-validated",
+            "message": "Objects are revalidated against S3 with a HEAD request on every read",
+            **data_service.get_cache_stats()
         }
     }
     
@@ -120,14 +124,14 @@ app.add_middleware(
 app.include_router(auth_router)
 
 # Initialize data service
-data_service = DataService()
+data_service = get_data_service()
 
 # Log server configuration
 logger.info("=" * 50)
 logger.info("Server Configuration:")
 logger.info(f"Data Source: {Config.get_mode_description()}")
 logger.info(f"S3 Mode: {'ENABLED' if Config.S3_MODE else 'DISABLED'}")
-logger.info(f"Caching: DISABLED - Always fresh data")
+logger.info(f"Caching: ETag-validated LRU - bodies are revalidated against S3 on every read")
 logger.info(f"S3 Bucket: {Config.S3_BUCKET_NAME}")
 logger.info(f"AWS Region: {Config.AWS_REGION}")
 logger.info("=" * 50)
@@ -135,7 +139,7 @@ logger.info("=" * 50)
 # Initialize search index
 logger.info("Initializing search index...")
 try:
-    search_service.build_index()
+    search_service.build_index(use_snapshot=True)
     stats = search_service.get_stats()
     logger.info(f"Search index initialized with {stats['total_documents']} documents")
 except Exception as e:
@@ -213,7 +217,36 @@ DATA_TYPE_KEYS = {
     "glossary": "terms"
 }
 
+# One lock per data file. Async handlers await the S3 read and write in worker
+# threads, so without these two requests could read the same snapshot and the
+# later write would drop the earlier one's change.
+file_locks: Dict[str, asyncio.Lock] = {}
 
+def get_file_lock(file_path: str) -> asyncio.Lock:
+    """Get the lock that serializes read-modify-write cycles on a data file"""
+    lock = file_locks.get(file_path)
+    if lock is None:
+        lock = file_locks[file_path] = asyncio.Lock()
+    return lock
+
+def locks_files(*file_paths: str):
+    """
+    Run an async handler while holding the locks of the data files it rewrites
+    
+    Locks are taken in sorted order so handlers that touch several files can't deadlock.
+    
+    Args:
+        file_paths: Data files (values of JSON_FILES) the handler reads and writes back
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            async with AsyncExitStack() as stack:
+                for file_path in sorted(set(file_paths)):
+                    await stack.enter_async_context(get_file_lock(file_path))
+                return await handler(*args, **kwargs)
+        return wrapper
+    return decorator
 
 def get_cached_data(file_name: str) -> Dict:
     """Get data from the configured data source (no caching)."""
@@ -243,7 +276,7 @@ async def get_agreements():
         list: List of all agreements
     """
     try:
-        agreements_data = read_json_file(JSON_FILES['dataAgreements'])
+        agreements_data = await read_json_file_async(JSON_FILES['dataAgreements'])
         return agreements_data['agreements']
     except Exception as e:
         logger.error(f"Error retrieving agreements: {str(e)}")
@@ -387,13 +420,31 @@ def get_paginated_json_file(
 def get_count(file_name: str):
     """Get the count of items in a specific data file."""
     logger.info(f"Count request for {file_name} - Using {Config.get_data_source()} mode")
-    data = get_cached_data(file_name)
     key = DATA_TYPE_KEYS.get(file_name)
     
-    if not key or key not in data:
+    if not key:
         raise HTTPException(status_code=500, detail=f"Invalid data structure for {file_name}")
     
-    return {"count": len(data[key])}
+    # Only the array length is needed, so stream its items instead of loading the file
+    items = data_service.read_json_items(JSON_FILES[file_name], f"{key}.item")
+    if items is None:
+        raise HTTPException(status_code=500, detail=f"Failed to load data for {file_name}")
+    
+    try:
+        count = sum(1 for _ in items)
+    except Exception as e:
+        logger.error(f"Error counting items in {file_name}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error loading data: {str(e)}")
+    
+    if count == 0:
+        # Nothing streamed: the value may be an object (e.g. toolkit's components by
+        # type) rather than an array, or missing, so check against the parsed file
+        data = get_cached_data(file_name)
+        if key not in data:
+            raise HTTPException(status_code=500, detail=f"Invalid data structure for {file_name}")
+        count = len(data[key])
+    
+    return {"count": count}
 
 @app.get("/api/agreements/by-model/{model_short_name}")
 async def get_agreements_by_model(model_short_name: str):
@@ -410,8 +461,8 @@ async def get_agreements_by_model(model_short_name: str):
         HTTPException: If the model is not found
     """
     try:
-        agreements_data = read_json_file(JSON_FILES['dataAgreements'])
-        model_data = read_json_file(JSON_FILES['models'])
+        agreements_data = await read_json_file_async(JSON_FILES['dataAgreements'])
+        model_data = await read_json_file_async(JSON_FILES['models'])
 
         # Find the model by short name (case-insensitive)
         model = next((m for m in model_data['models'] if m['shortName'].lower() == model_short_name.lower()), None)
@@ -450,6 +501,7 @@ async def get_agreements_by_model(model_short_name: str):
         )
 
 @app.post("/api/models")
+@locks_files(JSON_FILES['models'])
 async def create_model(request: CreateModelRequest):
     """
     Create a new data model.
@@ -467,7 +519,7 @@ async def create_model(request: CreateModelRequest):
         logger.info(f"Create request for new model")
         
         # Read current models data
-        models_data = read_json_file(JSON_FILES['models'])
+        models_data = await read_json_file_async(JSON_FILES['models'])
         
         # Check if the shortName already exists
         for existing_model in models_data['models']:
@@ -509,7 +561,7 @@ async def create_model(request: CreateModelRequest):
         models_data['models'].append(new_model)
         
         # Save the updated data to S3
-        data_service.write_json_file(JSON_FILES['models'], models_data)
+        await asyncio.to_thread(data_service.write_json_file, JSON_FILES['models'], models_data)
         logger.info(f"Created new model in S3")
         
         # Update search index
@@ -532,6 +584,7 @@ async def create_model(request: CreateModelRequest):
         )
 
 @app.delete("/api/models/{short_name}")
+@locks_files(JSON_FILES['models'])
 async def delete_model(short_name: str):
     """
     Delete a data model by its short name.
@@ -549,7 +602,7 @@ async def delete_model(short_name: str):
         logger.info(f"Delete request for model: {short_name}")
         
         # Read current models data
-        models_data = data_service.read_json_file('dataModels.json')
+        models_data = await asyncio.to_thread(data_service.read_json_file, 'dataModels.json')
         
         # Find the model to delete
         model_to_delete = None
@@ -568,11 +621,11 @@ async def delete_model(short_name: str):
         models_data['models'] = [m for m in models_data['models'] if m['shortName'].lower() != short_name.lower()]
         
         # Save the updated data to S3
-        data_service.write_json_file(JSON_FILES['models'], models_data)
+        await asyncio.to_thread(data_service.write_json_file, JSON_FILES['models'], models_data)
         logger.info(f"Model deleted from S3")
         
         # Trigger search reindex for models
-        trigger_reindex('dataModels.json')
+        await asyncio.to_thread(trigger_reindex, 'dataModels.json')
         
         logger.info(f"Model {short_name} deleted successfully")
         
@@ -590,6 +643,7 @@ async def delete_model(short_name: str):
         )
 
 @app.post("/api/models/{short_name}/click")
+@locks_files(JSON_FILES['models'])
 async def track_model_click(short_name: str):
     """
     Track a click on a data model card and increment the click counter.
@@ -607,7 +661,7 @@ async def track_model_click(short_name: str):
         logger.info(f"Click tracking request for model: {short_name}")
         
         # Read current models data
-        models_data = data_service.read_json_file(JSON_FILES['models'])
+        models_data = await asyncio.to_thread(data_service.read_json_file, JSON_FILES['models'])
         
         # Find the model to update
         model_index = None
@@ -636,8 +690,8 @@ async def track_model_click(short_name: str):
         # Update the model in the array
         models_data['models'][model_index] = model
         
-        # Save the updated data to S3
-        data_service.write_json_file(JSON_FILES['models'], models_data)
+        # Queue the save without waiting for S3; later reads already see the new count
+        data_service.submit_json_write(JSON_FILES['models'], models_data)
         logger.info(f"Updated click count for model {short_name} to {model['meta']['clickCount']}")
         
         return {
@@ -656,6 +710,7 @@ async def track_model_click(short_name: str):
         )
 
 @app.put("/api/models/{short_name}")
+@locks_files(JSON_FILES['models'], JSON_FILES['dataAgreements'])
 async def update_model(short_name: str, request: UpdateModelRequest):
     """
     Update a data model by its short name.
@@ -674,7 +729,7 @@ async def update_model(short_name: str, request: UpdateModelRequest):
         logger.info(f"Update request for model: {short_name}")
         
         # Read current models data
-        models_data = data_service.read_json_file('dataModels.json')
+        models_data = await asyncio.to_thread(data_service.read_json_file, 'dataModels.json')
         
         # Find the model to update
         model_index = None
@@ -720,7 +775,7 @@ async def update_model(short_name: str, request: UpdateModelRequest):
             # Update agreements that reference the old shortName (only if requested)
             if request.updateAssociatedLinks:
                 try:
-                    agreements_data = data_service.read_json_file('dataAgreements.json')
+                    agreements_data = await asyncio.to_thread(data_service.read_json_file, 'dataAgreements.json')
                     agreements_updated = False
                     
                     for agreement in agreements_data['agreements']:
@@ -730,10 +785,10 @@ async def update_model(short_name: str, request: UpdateModelRequest):
                             logger.info(f"Updated agreement {agreement['id']} modelShortName from '{old_short_name}' to '{new_short_name}'")
                     
                     if agreements_updated:
-                        data_service.write_json_file('dataAgreements.json', agreements_data)
+                        await asyncio.to_thread(data_service.write_json_file, 'dataAgreements.json', agreements_data)
                         logger.info(f"Updated agreements file with new modelShortName references")
                         # Trigger reindex for agreements
-                        trigger_reindex('dataAgreements.json')
+                        await asyncio.to_thread(trigger_reindex, 'dataAgreements.json')
                     
                 except Exception as e:
                     logger.error(f"Error updating agreements: {str(e)}")
@@ -763,11 +818,11 @@ async def update_model(short_name: str, request: UpdateModelRequest):
         models_data['models'][model_index] = updated_model
         
         # Save the updated data to S3
-        data_service.write_json_file(JSON_FILES['models'], models_data)
+        await asyncio.to_thread(data_service.write_json_file, JSON_FILES['models'], models_data)
         logger.info(f"Updated S3 file")
         
         # Trigger search reindex for models
-        trigger_reindex('dataModels.json')
+        await asyncio.to_thread(trigger_reindex, 'dataModels.json')
         
         # No cache to clear - always fresh data
         logger.info("No caching - data will be fresh on next request")
@@ -802,6 +857,14 @@ def write_json_file(file_path: str, data: Dict):
     if not success:
         raise HTTPException(status_code=500, detail=f"Failed to write file: {file_path}")
 
+async def read_json_file_async(file_path: str) -> Dict:
+    """Read JSON file using DataService without blocking the event loop"""
+    return await asyncio.to_thread(read_json_file, file_path)
+
+async def write_json_file_async(file_path: str, data: Dict):
+    """Write JSON file using DataService without blocking the event loop"""
+    await asyncio.to_thread(write_json_file, file_path, data)
+
 def update_search_index(data_type: str, action: str, item: Dict[str, Any] = None, item_id: str = None):
     """Update search index after data changes"""
     try:
@@ -823,6 +886,7 @@ def update_search_index(data_type: str, action: str, item: Dict[str, Any] = None
 
 # Agreement Management Endpoints
 @app.post("/api/agreements")
+@locks_files(JSON_FILES['dataAgreements'])
 async def create_agreement(request: Dict[str, Any]):
     """
     Create a new agreement.
@@ -838,7 +902,7 @@ async def create_agreement(request: Dict[str, Any]):
     """
     try:
         logger.info(f"Create request for new agreement")
-        agreements_data = read_json_file(JSON_FILES['dataAgreements'])
+        agreements_data = await read_json_file_async(JSON_FILES['dataAgreements'])
         
         # Generate automatic ID
         new_id = generate_next_agreement_id(agreements_data)
@@ -849,7 +913,7 @@ async def create_agreement(request: Dict[str, Any]):
         new_agreement['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         agreements_data['agreements'].append(new_agreement)
-        write_json_file(JSON_FILES['dataAgreements'], agreements_data)
+        await write_json_file_async(JSON_FILES['dataAgreements'], agreements_data)
         
         # Update search index
         update_search_index("dataAgreements", "add", new_agreement, new_id)
@@ -867,6 +931,7 @@ async def create_agreement(request: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Error creating agreement: {str(e)}")
 
 @app.put("/api/agreements/{agreement_id}")
+@locks_files(JSON_FILES['dataAgreements'])
 async def update_agreement(agreement_id: str, request: Dict[str, Any]):
     """
     Update an existing agreement.
@@ -883,7 +948,7 @@ async def update_agreement(agreement_id: str, request: Dict[str, Any]):
     """
     try:
         logger.info(f"Update request for agreement: {agreement_id}")
-        agreements_data = read_json_file(JSON_FILES['dataAgreements'])
+        agreements_data = await read_json_file_async(JSON_FILES['dataAgreements'])
         
         # Find the agreement to update
         agreement_to_update = None
@@ -907,7 +972,7 @@ async def update_agreement(agreement_id: str, request: Dict[str, Any]):
         ]
         agreements_data['agreements'].append(updated_agreement)
         
-        write_json_file(JSON_FILES['dataAgreements'], agreements_data)
+        await write_json_file_async(JSON_FILES['dataAgreements'], agreements_data)
         
         # Update search index
         update_search_index("dataAgreements", "update", updated_agreement, agreement_id)
@@ -925,6 +990,7 @@ async def update_agreement(agreement_id: str, request: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Error updating agreement: {str(e)}")
 
 @app.delete("/api/agreements/{agreement_id}")
+@locks_files(JSON_FILES['dataAgreements'])
 async def delete_agreement(agreement_id: str):
     """
     Delete an agreement by its ID.
@@ -940,7 +1006,7 @@ async def delete_agreement(agreement_id: str):
     """
     try:
         logger.info(f"Delete request for agreement: {agreement_id}")
-        agreements_data = read_json_file(JSON_FILES['dataAgreements'])
+        agreements_data = await read_json_file_async(JSON_FILES['dataAgreements'])
         
         agreement_to_delete = None
         for agreement in agreements_data['agreements']:
@@ -956,7 +1022,7 @@ async def delete_agreement(agreement_id: str):
             if a['id'].lower() != agreement_id.lower()
         ]
         
-        write_json_file(JSON_FILES['dataAgreements'], agreements_data)
+        await write_json_file_async(JSON_FILES['dataAgreements'], agreements_data)
         
         # Update search index
         update_search_index("dataAgreements", "delete", item_id=agreement_id)
@@ -1023,6 +1089,7 @@ def generate_next_agreement_id(agreements_data: Dict) -> str:
 
 # Reference Data Management Endpoints
 @app.post("/api/reference")
+@locks_files(JSON_FILES['reference'])
 async def create_reference_item(request: Dict[str, Any]):
     """
     Create a new reference data item.
@@ -1038,7 +1105,7 @@ async def create_reference_item(request: Dict[str, Any]):
     """
     try:
         logger.info(f"Create request for new reference item")
-        reference_data = read_json_file(JSON_FILES['reference'])
+        reference_data = await read_json_file_async(JSON_FILES['reference'])
         
         # Generate automatic ID
         new_id = generate_next_reference_id(reference_data)
@@ -1049,7 +1116,7 @@ async def create_reference_item(request: Dict[str, Any]):
         new_item['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         reference_data['items'].append(new_item)
-        write_json_file(JSON_FILES['reference'], reference_data)
+        await write_json_file_async(JSON_FILES['reference'], reference_data)
         
         # Update search index
         update_search_index("reference", "add", new_item, new_id)
@@ -1067,6 +1134,7 @@ async def create_reference_item(request: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Error creating reference item: {str(e)}")
 
 @app.put("/api/reference/{item_id}")
+@locks_files(JSON_FILES['reference'])
 async def update_reference_item(item_id: str, request: Dict[str, Any]):
     """
     Update an existing reference data item.
@@ -1083,7 +1151,7 @@ async def update_reference_item(item_id: str, request: Dict[str, Any]):
     """
     try:
         logger.info(f"Update request for reference item: {item_id}")
-        reference_data = read_json_file(JSON_FILES['reference'])
+        reference_data = await read_json_file_async(JSON_FILES['reference'])
         
         # Find the reference item to update
         item_to_update = None
@@ -1107,7 +1175,7 @@ async def update_reference_item(item_id: str, request: Dict[str, Any]):
         ]
         reference_data['items'].append(updated_item)
         
-        write_json_file(JSON_FILES['reference'], reference_data)
+        await write_json_file_async(JSON_FILES['reference'], reference_data)
         
         # Update search index
         update_search_index("reference", "update", updated_item, item_id)
@@ -1125,6 +1193,7 @@ async def update_reference_item(item_id: str, request: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Error updating reference item: {str(e)}")
 
 @app.delete("/api/reference/{item_id}")
+@locks_files(JSON_FILES['reference'])
 async def delete_reference_item(item_id: str):
     """
     Delete a reference data item by its ID.
@@ -1140,7 +1209,7 @@ async def delete_reference_item(item_id: str):
     """
     try:
         logger.info(f"Delete request for reference item: {item_id}")
-        reference_data = read_json_file(JSON_FILES['reference'])
+        reference_data = await read_json_file_async(JSON_FILES['reference'])
         
         item_to_delete = None
         for item in reference_data['items']:
@@ -1156,7 +1225,7 @@ async def delete_reference_item(item_id: str):
             if i['id'].lower() != item_id.lower()
         ]
         
-        write_json_file(JSON_FILES['reference'], reference_data)
+        await write_json_file_async(JSON_FILES['reference'], reference_data)
         
         # Update search index
         update_search_index("reference", "delete", item_id=item_id)
@@ -1175,6 +1244,7 @@ async def delete_reference_item(item_id: str):
 
 # Glossary Management Endpoints
 @app.post("/api/glossary")
+@locks_files(JSON_FILES['glossary'])
 async def create_glossary_term(request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
     """
     Create a new glossary term.
@@ -1190,7 +1260,7 @@ async def create_glossary_term(request: Dict[str, Any], current_user: dict = Dep
     """
     try:
         logger.info(f"Create request for new glossary term")
-        glossary_data = read_json_file(JSON_FILES['glossary'])
+        glossary_data = await read_json_file_async(JSON_FILES['glossary'])
         
         # Generate automatic ID if not provided
         if not request.get('id'):
@@ -1221,7 +1291,7 @@ async def create_glossary_term(request: Dict[str, Any], current_user: dict = Dep
             glossary_data['terms'] = []
         glossary_data['terms'].append(new_term)
         
-        write_json_file(JSON_FILES['glossary'], glossary_data)
+        await write_json_file_async(JSON_FILES['glossary'], glossary_data)
         
         logger.info(f"Created new glossary term in S3")
         logger.info(f"Glossary term {new_id} created successfully")
@@ -1238,6 +1308,7 @@ async def create_glossary_term(request: Dict[str, Any], current_user: dict = Dep
         raise HTTPException(status_code=500, detail=f"Error creating glossary term: {str(e)}")
 
 @app.put("/api/glossary/{term_id}")
+@locks_files(JSON_FILES['glossary'])
 async def update_glossary_term(term_id: str, request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
     """
     Update an existing glossary term.
@@ -1254,7 +1325,7 @@ async def update_glossary_term(term_id: str, request: Dict[str, Any], current_us
     """
     try:
         logger.info(f"Update request for glossary term: {term_id}")
-        glossary_data = read_json_file(JSON_FILES['glossary'])
+        glossary_data = await read_json_file_async(JSON_FILES['glossary'])
         
         # Find the glossary term to update
         term_to_update = None
@@ -1279,7 +1350,7 @@ async def update_glossary_term(term_id: str, request: Dict[str, Any], current_us
         ]
         glossary_data['terms'].append(updated_term)
         
-        write_json_file(JSON_FILES['glossary'], glossary_data)
+        await write_json_file_async(JSON_FILES['glossary'], glossary_data)
         
         logger.info(f"Glossary term updated in S3")
         logger.info(f"Glossary term {term_id} updated successfully")
@@ -1296,6 +1367,7 @@ async def update_glossary_term(term_id: str, request: Dict[str, Any], current_us
         raise HTTPException(status_code=500, detail=f"Error updating glossary term: {str(e)}")
 
 @app.delete("/api/glossary/{term_id}")
+@locks_files(JSON_FILES['glossary'])
 async def delete_glossary_term(term_id: str, current_user: dict = Depends(require_editor_or_admin)):
     """
     Delete a glossary term by its ID.
@@ -1311,7 +1383,7 @@ async def delete_glossary_term(term_id: str, current_user: dict = Depends(requir
     """
     try:
         logger.info(f"Delete request for glossary term: {term_id}")
-        glossary_data = read_json_file(JSON_FILES['glossary'])
+        glossary_data = await read_json_file_async(JSON_FILES['glossary'])
         
         term_to_delete = None
         for term in glossary_data.get('terms', []):
@@ -1327,7 +1399,7 @@ async def delete_glossary_term(term_id: str, current_user: dict = Depends(requir
             if t.get('id', '').lower() != term_id.lower()
         ]
         
-        write_json_file(JSON_FILES['glossary'], glossary_data)
+        await write_json_file_async(JSON_FILES['glossary'], glossary_data)
         
         logger.info(f"Glossary term deleted from S3")
         logger.info(f"Glossary term {term_id} deleted successfully")
@@ -1345,6 +1417,7 @@ async def delete_glossary_term(term_id: str, current_user: dict = Depends(requir
 
 # Applications CRUD endpoints
 @app.post("/api/applications")
+@locks_files(JSON_FILES['applications'])
 async def create_application(application: Dict[str, Any]):
     """
     Create a new application.
@@ -1360,7 +1433,7 @@ async def create_application(application: Dict[str, Any]):
     """
     try:
         logger.info(f"Create request for application: {application.get('name', 'Unknown')}")
-        applications_data = read_json_file(JSON_FILES['applications'])
+        applications_data = await read_json_file_async(JSON_FILES['applications'])
         
         # Generate UUID for new application
         new_id = str(uuid.uuid4())
@@ -1382,7 +1455,7 @@ async def create_application(application: Dict[str, Any]):
         
         applications_data['applications'].append(new_application)
         
-        write_json_file(JSON_FILES['applications'], applications_data)
+        await write_json_file_async(JSON_FILES['applications'], applications_data)
         
         # Update search index
         update_search_index("applications", "add", new_application, new_id)
@@ -1400,6 +1473,7 @@ async def create_application(application: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Error creating application: {str(e)}")
 
 @app.put("/api/applications/{application_id}")
+@locks_files(JSON_FILES['applications'])
 async def update_application(application_id: int, application: Dict[str, Any]):
     """
     Update an existing application by its ID.
@@ -1416,7 +1490,7 @@ async def update_application(application_id: int, application: Dict[str, Any]):
     """
     try:
         logger.info(f"Update request for application: {application_id}")
-        applications_data = read_json_file(JSON_FILES['applications'])
+        applications_data = await read_json_file_async(JSON_FILES['applications'])
         
         # Find the application to update
         app_to_update = None
@@ -1445,7 +1519,7 @@ async def update_application(application_id: int, application: Dict[str, Any]):
         
         applications_data['applications'][app_to_update] = updated_application
         
-        write_json_file(JSON_FILES['applications'], applications_data)
+        await write_json_file_async(JSON_FILES['applications'], applications_data)
         
         # Update search index
         update_search_index("applications", "update", updated_application, str(application_id))
@@ -1463,6 +1537,7 @@ async def update_application(application_id: int, application: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Error updating application: {str(e)}")
 
 @app.delete("/api/applications/{application_id}")
+@locks_files(JSON_FILES['applications'])
 async def delete_application(application_id: int):
     """
     Delete an application by its ID.
@@ -1478,7 +1553,7 @@ async def delete_application(application_id: int):
     """
     try:
         logger.info(f"Delete request for application: {application_id}")
-        applications_data = read_json_file(JSON_FILES['applications'])
+        applications_data = await read_json_file_async(JSON_FILES['applications'])
         
         app_to_delete = None
         for app in applications_data['applications']:
@@ -1494,7 +1569,7 @@ async def delete_application(application_id: int):
             if app['id'] != application_id
         ]
         
-        write_json_file(JSON_FILES['applications'], applications_data)
+        await write_json_file_async(JSON_FILES['applications'], applications_data)
         
         # Update search index
         update_search_index("applications", "delete", item_id=str(application_id))
@@ -1539,6 +1614,7 @@ def get_toolkit_data() -> Dict[str, Any]:
 
 # Toolkit CRUD endpoints
 @app.post("/api/toolkit")
+@locks_files(JSON_FILES['toolkit'])
 async def create_toolkit_component(component: Dict[str, Any]):
     """
     Create a new toolkit component.
@@ -1554,7 +1630,7 @@ async def create_toolkit_component(component: Dict[str, Any]):
     """
     try:
         logger.info(f"Create request for toolkit component: {component.get('name', 'Unknown')}")
-        toolkit_data = get_toolkit_data()
+        toolkit_data = await asyncio.to_thread(get_toolkit_data)
         
         # Determine component type and generate ID
         component_type = component.get('type', 'functions')
@@ -1601,7 +1677,7 @@ async def create_toolkit_component(component: Dict[str, Any]):
         
         toolkit_data['toolkit'][component_type].append(new_component)
         
-        write_json_file(JSON_FILES['toolkit'], toolkit_data)
+        await write_json_file_async(JSON_FILES['toolkit'], toolkit_data)
         
         # Update search index
         update_search_index("toolkit", "add", new_component, new_id)
@@ -1619,6 +1695,7 @@ async def create_toolkit_component(component: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Error creating toolkit component: {str(e)}")
 
 @app.put("/api/toolkit/packages/{package_id}")
+@locks_files(JSON_FILES['toolkit'])
 async def update_toolkit_package(
     package_id: str, 
     package_data: Dict[str, Any] = Body(...), 
@@ -1646,7 +1723,7 @@ async def update_toolkit_package(
             raise HTTPException(status_code=400, detail=f"Package data must be a dictionary, got {type(package_data)}")
         
         # Read toolkit data
-        toolkit_data = get_toolkit_data()
+        toolkit_data = await asyncio.to_thread(get_toolkit_data)
         
         packages = toolkit_data['toolkit'].get('packages', [])
         package_index = None
@@ -1726,7 +1803,7 @@ async def update_toolkit_package(
         try:
             logger.info(f"Attempting to write toolkit data to: {JSON_FILES['toolkit']}")
             logger.info(f"Toolkit data structure: {list(toolkit_data.keys())}")
-            write_json_file(JSON_FILES['toolkit'], toolkit_data)
+            await write_json_file_async(JSON_FILES['toolkit'], toolkit_data)
             logger.info(f"Package {package_name} (ID: {package_uuid}) saved successfully")
         except HTTPException as http_ex:
             logger.error(f"HTTPException writing toolkit file: {http_ex.status_code} - {http_ex.detail}", exc_info=True)
@@ -1746,6 +1823,7 @@ async def update_toolkit_package(
         raise HTTPException(status_code=500, detail=f"Error saving toolkit package: {str(e)}")
 
 @app.delete("/api/toolkit/packages/{package_id}")
+@locks_files(JSON_FILES['toolkit'])
 async def delete_toolkit_package(
     package_id: str,
     current_user: dict = Depends(require_editor_or_admin)
@@ -1762,7 +1840,7 @@ async def delete_toolkit_package(
     try:
         logger.info(f"Delete request for toolkit package: {package_id}")
         
-        toolkit_data = get_toolkit_data()
+        toolkit_data = await asyncio.to_thread(get_toolkit_data)
         
         packages = toolkit_data['toolkit'].get('packages', [])
         package_to_delete = None
@@ -1790,7 +1868,7 @@ async def delete_toolkit_package(
             if not (actual_id and pkg.get('id') == actual_id) and not (actual_name and pkg.get('name') == actual_name and not pkg.get('id'))
         ]
         
-        write_json_file(JSON_FILES['toolkit'], toolkit_data)
+        await write_json_file_async(JSON_FILES['toolkit'], toolkit_data)
         
         logger.info(f"Package {package_to_delete.get('name', 'Unknown')} (ID: {package_id}) deleted successfully")
         
@@ -1807,6 +1885,7 @@ async def delete_toolkit_package(
         raise HTTPException(status_code=500, detail=f"Error deleting toolkit package: {str(e)}")
 
 @app.put("/api/toolkit/{component_type}/{component_id}")
+@locks_files(JSON_FILES['toolkit'])
 async def update_toolkit_component(component_type: str, component_id: str, component: Dict[str, Any]):
     """
     Update an existing toolkit component by its ID.
@@ -1828,7 +1907,7 @@ async def update_toolkit_component(component_type: str, component_id: str, compo
         if component_type not in ['functions', 'containers', 'terraform']:
             raise HTTPException(status_code=400, detail="Invalid component type")
         
-        toolkit_data = get_toolkit_data()
+        toolkit_data = await asyncio.to_thread(get_toolkit_data)
         
         # Find the component to update
         comp_to_update = None
@@ -1878,7 +1957,7 @@ async def update_toolkit_component(component_type: str, component_id: str, compo
         
         toolkit_data['toolkit'][component_type][comp_to_update] = updated_component
         
-        write_json_file(JSON_FILES['toolkit'], toolkit_data)
+        await write_json_file_async(JSON_FILES['toolkit'], toolkit_data)
         
         # Update search index
         update_search_index("toolkit", "update", updated_component, component_id)
@@ -1896,6 +1975,7 @@ async def update_toolkit_component(component_type: str, component_id: str, compo
         raise HTTPException(status_code=500, detail=f"Error updating toolkit component: {str(e)}")
 
 @app.post("/api/toolkit/{component_type}/{component_id}/click")
+@locks_files(JSON_FILES['toolkit'])
 async def track_toolkit_component_click(component_type: str, component_id: str):
     """
     Track a click on a toolkit component card and increment the click counter.
@@ -1917,7 +1997,7 @@ async def track_toolkit_component_click(component_type: str, component_id: str):
             raise HTTPException(status_code=400, detail="Invalid component type")
         
         # Read current toolkit data
-        toolkit_data = get_toolkit_data()
+        toolkit_data = await asyncio.to_thread(get_toolkit_data)
         
         # Find the component to update
         component_index = None
@@ -1947,8 +2027,8 @@ async def track_toolkit_component_click(component_type: str, component_id: str):
         # Update the component in the array
         toolkit_data['toolkit'][component_type][component_index] = component
         
-        # Save the updated data to S3
-        write_json_file(JSON_FILES['toolkit'], toolkit_data)
+        # Queue the save without waiting for S3; later reads already see the new count
+        data_service.submit_json_write(JSON_FILES['toolkit'], toolkit_data)
         logger.info(f"Updated click count for {component_type}/{component_id} to {component['clickCount']}")
         
         return {
@@ -1968,6 +2048,7 @@ async def track_toolkit_component_click(component_type: str, component_id: str):
         )
 
 @app.delete("/api/toolkit/{component_type}/{component_id}")
+@locks_files(JSON_FILES['toolkit'])
 async def delete_toolkit_component(component_type: str, component_id: str):
     """
     Delete a toolkit component by its ID.
@@ -1988,7 +2069,7 @@ async def delete_toolkit_component(component_type: str, component_id: str):
         if component_type not in ['functions', 'containers', 'terraform']:
             raise HTTPException(status_code=400, detail="Invalid component type")
         
-        toolkit_data = get_toolkit_data()
+        toolkit_data = await asyncio.to_thread(get_toolkit_data)
         
         comp_to_delete = None
         for comp in toolkit_data['toolkit'][component_type]:
@@ -2005,7 +2086,7 @@ async def delete_toolkit_component(component_type: str, component_id: str):
         ]
         
         local_file_path = JSON_FILES['toolkit']
-        write_json_file(local_file_path, toolkit_data)
+        await write_json_file_async(local_file_path, toolkit_data)
         
         # Update search index
         update_search_index("toolkit", "delete", item_id=component_id)
@@ -2195,10 +2276,11 @@ def delete_policy(policy_id: str):
 # Debug endpoints
 @app.get("/api/debug/cache")
 def get_cache_status():
-    """Get the current status of the cache (disabled)."""
+    """Get the current status of the S3 read cache."""
     return {
-        "status": "Caching disabled",
-        "message": "All data is read fresh from S3 on each request",
+        "status": "ETag-validated LRU",
+        "message": "Cached bodies are served only while their S3 ETag is unchanged",
+        "stats": data_service.get_cache_stats(),
         "data_source": Config.get_data_source(),
         "s3_mode": Config.S3_MODE,
         "s3_bucket": Config.S3_BUCKET_NAME
@@ -2277,7 +2359,7 @@ async def manual_reindex(file_name: str = None, current_user: dict = Depends(req
         logger.info(f"Manual reindex triggered by {current_user.get('username', 'unknown')} for file: {file_name or 'all'}")
         
         # Trigger reindex
-        success = trigger_reindex(file_name)
+        success = await asyncio.to_thread(trigger_reindex, file_name)
         
         if success:
             stats = search_service.get_stats()
@@ -2303,6 +2385,7 @@ async def manual_reindex(file_name: str = None, current_user: dict = Depends(req
 
 # Statistics endpoints
 @app.post("/api/statistics/page-view")
+@locks_files(JSON_FILES['statistics'])
 async def track_page_view(page: str = Query(..., description="Page path/name to track")):
     """
     Track a page view.
@@ -2319,7 +2402,7 @@ async def track_page_view(page: str = Query(..., description="Page path/name to
         
         # Read or initialize statistics file
         try:
-            stats_data = read_json_file(JSON_FILES['statistics'])
+            stats_data = await read_json_file_async(JSON_FILES['statistics'])
         except HTTPException:
             # File doesn't exist, create new structure
             stats_data = {
@@ -2346,8 +2429,8 @@ async def track_page_view(page: str = Query(..., description="Page path/name to
         stats_data['pageViews'][page]['total'] += 1
         stats_data['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # Save updated statistics
-        write_json_file(JSON_FILES['statistics'], stats_data)
+        # Queue the save without waiting for S3; later reads already see the new counts
+        data_service.submit_json_write(JSON_FILES['statistics'], stats_data)
         
         logger.info(f"Tracked page view for {page} on {today}")
         
@@ -2364,6 +2447,7 @@ async def track_page_view(page: str = Query(..., description="Page path/name to
         raise HTTPException(status_code=500, detail=f"Error tracking page view: {str(e)}")
 
 @app.post("/api/statistics/site-visit")
+@locks_files(JSON_FILES['statistics'])
 async def track_site_visit():
     """
     Track a site visit (unique session).
@@ -2378,7 +2462,7 @@ async def track_site_visit():
         
         # Read or initialize statistics file
         try:
-            stats_data = read_json_file(JSON_FILES['statistics'])
+            stats_data = await read_json_file_async(JSON_FILES['statistics'])
         except HTTPException:
             # File doesn't exist, create new structure
             stats_data = {
@@ -2405,8 +2489,8 @@ async def track_site_visit():
         stats_data['siteVisits']['total'] += 1
         stats_data['lastUpdated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # Save updated statistics
-        write_json_file(JSON_FILES['statistics'], stats_data)
+        # Queue the save without waiting for S3; later reads already see the new counts
+        data_service.submit_json_write(JSON_FILES['statistics'], stats_data)
         
         logger.info(f"Tracked site visit on {today}")
         
@@ -2471,7 +2555,7 @@ async def get_rules_for_model(model_short_name: str):
     """
     try:
         try:
-            rules_data = read_json_file(JSON_FILES['rules'])
+            rules_data = await read_json_file_async(JSON_FILES['rules'])
         except HTTPException as e:
             logger.warning(f"Rules file not found or can't be read: {str(e)}")
             return {"rules": []}
@@ -2514,7 +2598,7 @@ async def get_rule_count(model_short_name: str):
     """
     try:
         try:
-            rules_data = read_json_file(JSON_FILES['rules'])
+            rules_data = await read_json_file_async(JSON_FILES['rules'])
         except HTTPException as e:
             logger.warning(f"Rules file not found or can't be read: {str(e)}")
             return {"count": 0}
@@ -2553,7 +2637,7 @@ async def get_rule_coverage(model_short_name: str):
     """
     try:
         try:
-            models_data = read_json_file(JSON_FILES['models'])
+            models_data = await read_json_file_async(JSON_FILES['models'])
             model = next(
                 (m for m in models_data.get('models', []) if m.get('shortName', '').lower() == model_short_name.lower()),
                 None
@@ -2566,7 +2650,7 @@ async def get_rule_coverage(model_short_name: str):
             logger.warning(f"Model with short name '{model_short_name}' not found")
         
         try:
-            rules_data = read_json_file(JSON_FILES['rules'])
+            rules_data = await read_json_file_async(JSON_FILES['rules'])
         except HTTPException:
             rules_data = {"rules": []}
         except Exception as e:
@@ -2613,6 +2697,7 @@ async def get_rule_coverage(model_short_name: str):
         raise HTTPException(status_code=500, detail=f"Error getting rule coverage: {str(e)}")
 
 @app.post("/api/rules")
+@locks_files(JSON_FILES['rules'])
 async def create_rule(request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
     """
     Create a new rule (model rule).
@@ -2627,7 +2712,7 @@ async def create_rule(request: Dict[str, Any], current_user: dict = Depends(requ
         logger.info(f"Create request for new model rule")
         
         try:
-            rules_data = read_json_file(JSON_FILES['rules'])
+            rules_data = await read_json_file_async(JSON_FILES['rules'])
         except HTTPException:
             rules_data = {"rules": []}
         
@@ -2639,7 +2724,7 @@ async def create_rule(request: Dict[str, Any], current_user: dict = Depends(requ
         new_rule['createdBy'] = current_user.get('username', 'unknown')
         
         rules_data['rules'].append(new_rule)
-        write_json_file(JSON_FILES['rules'], rules_data)
+        await write_json_file_async(JSON_FILES['rules'], rules_data)
         
         logger.info(f"Created new rule in S3")
         logger.info(f"Rule {new_id} created successfully")
@@ -2654,6 +2739,7 @@ async def create_rule(request: Dict[str, Any], current_user: dict = Depends(requ
         raise HTTPException(status_code=500, detail=f"Error creating rule: {str(e)}")
 
 @app.put("/api/rules/{rule_id}")
+@locks_files(JSON_FILES['rules'])
 async def update_rule(rule_id: str, request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
     """
     Update an existing model rule.
@@ -2668,7 +2754,7 @@ async def update_rule(rule_id: str, request: Dict[str, Any], current_user: dict
     try:
         logger.info(f"Update request for model rule: {rule_id}")
         
-        rules_data = read_json_file(JSON_FILES['rules'])
+        rules_data = await read_json_file_async(JSON_FILES['rules'])
         
         rule_to_update = None
         for i, rule in enumerate(rules_data.get('rules', [])):
@@ -2688,7 +2774,7 @@ async def update_rule(rule_id: str, request: Dict[str, Any], current_user: dict
         
         rules_data['rules'][rule_to_update] = updated_rule
         
-        write_json_file(JSON_FILES['rules'], rules_data)
+        await write_json_file_async(JSON_FILES['rules'], rules_data)
         
         logger.info(f"Rule updated in S3")
         logger.info(f"Rule {rule_id} updated successfully")
@@ -2705,6 +2791,7 @@ async def update_rule(rule_id: str, request: Dict[str, Any], current_user: dict
         raise HTTPException(status_code=500, detail=f"Error updating rule: {str(e)}")
 
 @app.delete("/api/rules/{rule_id}")
+@locks_files(JSON_FILES['rules'])
 async def delete_rule(rule_id: str, current_user: dict = Depends(require_editor_or_admin)):
     """
     Delete a model rule by its ID.
@@ -2718,7 +2805,7 @@ async def delete_rule(rule_id: str, current_user: dict = Depends(require_editor_
     try:
         logger.info(f"Delete request for model rule: {rule_id}")
         
-        rules_data = read_json_file(JSON_FILES['rules'])
+        rules_data = await read_json_file_async(JSON_FILES['rules'])
         
         rule_to_delete = None
         for rule in rules_data.get('rules', []):
@@ -2734,7 +2821,7 @@ async def delete_rule(rule_id: str, current_user: dict = Depends(require_editor_
             if r.get('id', '').lower() != rule_id.lower()
         ]
         
-        write_json_file(JSON_FILES['rules'], rules_data)
+        await write_json_file_async(JSON_FILES['rules'], rules_data)
         
         logger.info(f"Rule deleted from S3")
         logger.info(f"Rule {rule_id} deleted successfully")
@@ -2761,7 +2848,7 @@ async def get_all_country_rules():
     """
     try:
         try:
-            rules_data = read_json_file(JSON_FILES['countryRules'])
+            rules_data = await read_json_file_async(JSON_FILES['countryRules'])
         except HTTPException as e:
             logger.warning(f"Country rules file not found or can't be read: {str(e)}")
             return {"rules": []}
@@ -2800,7 +2887,7 @@ async def get_rules_for_country(country: str):
     """
     try:
         try:
-            rules_data = read_json_file(JSON_FILES['countryRules'])
+            rules_data = await read_json_file_async(JSON_FILES['countryRules'])
         except HTTPException as e:
             logger.warning(f"Country rules file not found or can't be read: {str(e)}")
             return {"rules": []}
@@ -2843,7 +2930,7 @@ async def get_country_rule_count(country: str):
     """
     try:
         try:
-            rules_data = read_json_file(JSON_FILES['countryRules'])
+            rules_data = await read_json_file_async(JSON_FILES['countryRules'])
         except HTTPException as e:
             logger.warning(f"Country rules file not found or can't be read: {str(e)}")
             return {"count": 0}
@@ -2882,7 +2969,7 @@ async def get_country_rule_coverage(country: str):
     """
     try:
         try:
-            rules_data = read_json_file(JSON_FILES['countryRules'])
+            rules_data = await read_json_file_async(JSON_FILES['countryRules'])
         except HTTPException:
             rules_data = {"rules": []}
         except Exception as e:
@@ -2929,6 +3016,7 @@ async def get_country_rule_coverage(country: str):
         raise HTTPException(status_code=500, detail=f"Error getting country rule coverage: {str(e)}")
 
 @app.post("/api/country-rules")
+@locks_files(JSON_FILES['countryRules'])
 async def create_country_rule(request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
     """
     Create a new country rule.
@@ -2943,7 +3031,7 @@ async def create_country_rule(request: Dict[str, Any], current_user: dict = Depe
         logger.info(f"Create request for new country rule")
         
         try:
-            rules_data = read_json_file(JSON_FILES['countryRules'])
+            rules_data = await read_json_file_async(JSON_FILES['countryRules'])
         except HTTPException:
             rules_data = {"rules": []}
         
@@ -2955,7 +3043,7 @@ async def create_country_rule(request: Dict[str, Any], current_user: dict = Depe
         new_rule['createdBy'] = current_user.get('username', 'unknown')
         
         rules_data['rules'].append(new_rule)
-        write_json_file(JSON_FILES['countryRules'], rules_data)
+        await write_json_file_async(JSON_FILES['countryRules'], rules_data)
         
         logger.info(f"Created new country rule in S3")
         logger.info(f"Country rule {new_id} created successfully")
@@ -2970,6 +3058,7 @@ async def create_country_rule(request: Dict[str, Any], current_user: dict = Depe
         raise HTTPException(status_code=500, detail=f"Error creating country rule: {str(e)}")
 
 @app.put("/api/country-rules/{rule_id}")
+@locks_files(JSON_FILES['countryRules'])
 async def update_country_rule(rule_id: str, request: Dict[str, Any], current_user: dict = Depends(require_editor_or_admin)):
     """
     Update an existing country rule.
@@ -2984,7 +3073,7 @@ async def update_country_rule(rule_id: str, request: Dict[str, Any], current_use
     try:
         logger.info(f"Update request for country rule: {rule_id}")
         
-        rules_data = read_json_file(JSON_FILES['countryRules'])
+        rules_data = await read_json_file_async(JSON_FILES['countryRules'])
         
         rule_to_update = None
         for i, rule in enumerate(rules_data.get('rules', [])):
@@ -3004,7 +3093,7 @@ async def update_country_rule(rule_id: str, request: Dict[str, Any], current_use
         
         rules_data['rules'][rule_to_update] = updated_rule
         
-        write_json_file(JSON_FILES['countryRules'], rules_data)
+        await write_json_file_async(JSON_FILES['countryRules'], rules_data)
         
         logger.info(f"Country rule updated in S3")
         logger.info(f"Country rule {rule_id} updated successfully")
@@ -3021,6 +3110,7 @@ async def update_country_rule(rule_id: str, request: Dict[str, Any], current_use
         raise HTTPException(status_code=500, detail=f"Error updating country rule: {str(e)}")
 
 @app.delete("/api/country-rules/{rule_id}")
+@locks_files(JSON_FILES['countryRules'])
 async def delete_country_rule(rule_id: str, current_user: dict = Depends(require_editor_or_admin)):
     """
     Delete a country rule by its ID.
@@ -3034,7 +3124,7 @@ async def delete_country_rule(rule_id: str, current_user: dict = Depends(require
     try:
         logger.info(f"Delete request for country rule: {rule_id}")
         
-        rules_data = read_json_file(JSON_FILES['countryRules'])
+        rules_data = await read_json_file_async(JSON_FILES['countryRules'])
         
         rule_to_delete = None
         for rule in rules_data.get('rules', []):
@@ -3050,7 +3140,7 @@ async def delete_country_rule(rule_id: str, current_user: dict = Depends(require
             if r.get('id', '').lower() != rule_id.lower()
         ]
         
-        write_json_file(JSON_FILES['countryRules'], rules_data)
+        await write_json_file_async(JSON_FILES['countryRules'], rules_data)
         
         logger.info(f"Country rule deleted from S3")
         logger.info(f"Country rule {rule_id} deleted successfully")
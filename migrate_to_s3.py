@@ -7,6 +7,7 @@ Run this script once to migrate your data from local files to S3.
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from services.s3_service import S3Service
 from config import Config
 
@@ -14,14 +15,17 @@ from config import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Uploads are network-bound, so they run concurrently on a small thread pool
+MAX_UPLOAD_WORKERS = 10
+
 def migrate_files_to_s3():
     """Migrate all JSON files from local _data directory to S3."""
     
     # Initialize S3 service
-    s3_service = S3Service()
-    
-    if not s3_service.is_available():
-        logger.error("S3 service is not available. Please check your AWS credentials and S3 configuration.")
+    try:
+        s3_service = S3Service()
+    except RuntimeError as e:
+        logger.error(str(e))
         return False
     
     # List of files to migrate
@@ -60,9 +64,7 @@ def migrate_files_to_s3():
                 json.dump(sample_data, f, indent=2)
             logger.info(f"Created sample file: {filename}")
     
-    # Migrate each file
-    success_count = 0
-    for filename in files_to_migrate:
+    def _migrate_one(filename: str) -> bool:
         local_filepath = os.path.join(data_dir, filename)
         
         if os.path.exists(local_filepath):
@@ -76,7 +78,7 @@ def migrate_files_to_s3():
                 
                 if success:
                     logger.info(f"✅ Successfully migrated {filename}")
-                    success_count += 1
+                    return True
                 else:
                     logger.error(f"❌ Failed to migrate {filename}")
                     
@@ -84,13 +86,27 @@ def migrate_files_to_s3():
                 logger.error(f"❌ Error migrating {filename}: {e}")
         else:
             logger.warning(f"⚠️  File not found: {local_filepath}")
+        return False
+    
+    # Migrate the files concurrently; results are counted on this thread
+    success_count = 0
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(files_to_migrate))) as executor:
+        futures = [executor.submit(_migrate_one, filename) for filename in files_to_migrate]
+        for future in as_completed(futures):
+            if future.result():
+                success_count += 1
     
     logger.info(f"Migration completed: {success_count}/{len(files_to_migrate)} files migrated successfully")
     
-    # Verify migration
+    # Verify migration with a single listing instead of a HEAD request per file
     logger.info("Verifying migration...")
+    listed = s3_service.list_files()
+    present = set(listed) if listed is not None else None
     for filename in files_to_migrate:
-        exists = s3_service.file_exists(filename)
+        if present is not None:
+            exists = f"{s3_service.folder_prefix}/{filename}" in present
+        else:
+            exists = s3_service.file_exists(filename)
         status = "✅" if exists else "❌"
         logger.info(f"{status} {filename}: {'Found' if exists else 'Not found'}")
     
@@ -1,19 +1,43 @@
+import copy
 import json
 import os
 import logging
-from typing import Dict, Any, Optional
-from .s3_service import S3Service
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, Tuple
+from .s3_service import S3Service, _iter_prefix
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Process-wide DataService, created on first use by get_data_service()
+_data_service = None
+_data_service_lock = threading.Lock()
+
+# Threads uploading queued writes; uploads for any one file still run one at a time
+WRITE_BEHIND_MAX_WORKERS = 8
+
+class _PendingWrite:
+    """Latest snapshot queued for a file, shared by every writer queued behind one upload"""
+    
+    def __init__(self, file_path: str, data: Dict[str, Any]):
+        self.file_path = file_path
+        self.data = data
+        self.future = Future()
+
 class DataService:
     """Service class for handling data operations from different sources"""
     
     def __init__(self):
+        # S3Service raises RuntimeError if the client or bucket isn't configured
         self.s3_service = S3Service()
-        if not self.s3_service.is_available():
-            raise RuntimeError("S3 service is not available. Please check your AWS credentials and S3 configuration.")
+        
+        # Write-behind state keyed by S3 key: the snapshot being uploaded, and the
+        # latest snapshot queued behind it (merging every write made meanwhile)
+        self._pending_writes: Dict[str, _PendingWrite] = {}
+        self._inflight_writes: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._write_executor = ThreadPoolExecutor(max_workers=WRITE_BEHIND_MAX_WORKERS, thread_name_prefix='s3-write')
         
     def read_json_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -25,12 +49,57 @@ class DataService:
         Returns:
             Dict containing the JSON data or None if failed
         """
-        logger.info(f"Reading from S3: {file_path}")
-        return self._read_from_s3(file_path)
+        # Serve writes that haven't reached S3 yet so read-modify-write stays consistent
+        pending = self._pending_snapshot(file_path)
+        if pending is not None:
+            return copy.deepcopy(pending)
+        
+        logger.debug("Reading from S3: %s", file_path)
+        return self.s3_service.read_json_file(file_path)
+    
+    def read_json_with_meta(self, file_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[int], Optional[str]]:
+        """
+        Read a JSON file from S3 together with its stored size and ETag
+        
+        Args:
+            file_path (str): Path to the JSON file
+            
+        Returns:
+            Tuple of (data, size in bytes, ETag), or (None, None, None) if failed.
+            While a write to the file is still queued, its data is returned with
+            size and ETag None, as the stored object no longer matches it.
+        """
+        # Queued writes win over S3, as in read_json_file
+        pending = self._pending_snapshot(file_path)
+        if pending is not None:
+            return copy.deepcopy(pending), None, None
+        
+        logger.debug("Reading from S3 with metadata: %s", file_path)
+        return self.s3_service.read_json_with_meta(file_path)
+    
+    def read_json_items(self, file_path: str, prefix: str) -> Optional[Iterator[Any]]:
+        """
+        Stream the values at a JSON prefix (e.g. 'models.item') from S3
+        
+        Args:
+            file_path (str): Path to the JSON file
+            prefix (str): ijson prefix of the values to yield
+            
+        Returns:
+            Iterator over the matching values, or None if the file could not be opened
+        """
+        # Queued writes win over S3, as in read_json_file; items are copied so callers
+        # can't change the snapshot that is still waiting to be uploaded
+        pending = self._pending_snapshot(file_path)
+        if pending is not None:
+            return map(copy.deepcopy, _iter_prefix(pending, prefix.split('.') if prefix else []))
+        
+        logger.debug("Streaming from S3: %s (%s)", file_path, prefix)
+        return self.s3_service.read_json_items(file_path, prefix)
     
     def write_json_file(self, file_path: str, data: Dict[str, Any]) -> bool:
         """
-        Write a JSON file to S3
+        Write a JSON file to S3 and wait for the upload
         
         Args:
             file_path (str): Path to the JSON file
@@ -39,16 +108,73 @@ class DataService:
         Returns:
             bool: True if successful, False otherwise
         """
-        logger.info(f"Writing to S3: {file_path}")
-        return self.s3_service.write_json_file(file_path, data)
+        return self.submit_json_write(file_path, data).result()
     
-    def _read_from_s3(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Read JSON file from S3"""
-        try:
-            return self.s3_service.read_json_file(file_path)
-        except Exception as e:
-            logger.error(f"Error reading from S3: {e}")
+    def submit_json_write(self, file_path: str, data: Dict[str, Any]) -> "Future[bool]":
+        """
+        Queue a JSON file for writing to S3 without waiting for the upload
+        
+        An idle file starts uploading right away. While an upload for the same file is
+        running, further writes are merged into one follow-up upload of the latest
+        snapshot (last writer wins). Reads through read_json_file see queued data
+        immediately.
+        
+        Args:
+            file_path (str): Path to the JSON file
+            data (Dict): Data to write
+            
+        Returns:
+            Future resolving to True once the data (or a later snapshot) is in S3,
+            False if that upload failed
+        """
+        logger.debug("Writing to S3: %s", file_path)
+        s3_key = self.s3_service._resolve_key(file_path)
+        
+        with self._pending_lock:
+            pending = self._pending_writes.get(s3_key)
+            if pending is not None:
+                # A follow-up upload is already queued; hand it our snapshot
+                pending.file_path = file_path
+                pending.data = data
+                return pending.future
+            
+            pending = _PendingWrite(file_path, data)
+            if s3_key in self._inflight_writes:
+                # Uploaded once the current upload for this file finishes
+                self._pending_writes[s3_key] = pending
+                return pending.future
+            self._inflight_writes[s3_key] = data
+        
+        self._write_executor.submit(self._upload_writes, s3_key, pending)
+        return pending.future
+    
+    def _upload_writes(self, s3_key: str, write: _PendingWrite) -> None:
+        """Upload a snapshot, then any snapshot queued for the same file while it ran"""
+        while write is not None:
+            try:
+                result = self.s3_service.write_json_file(write.file_path, write.data)
+            except Exception as e:
+                logger.error("Unexpected error writing %s: %s", write.file_path, e)
+                result = False
+            write.future.set_result(result)
+            
+            with self._pending_lock:
+                write = self._pending_writes.pop(s3_key, None)
+                if write is None:
+                    del self._inflight_writes[s3_key]
+                else:
+                    self._inflight_writes[s3_key] = write.data
+    
+    def _pending_snapshot(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Get data written to file_path that hasn't finished uploading yet, if any"""
+        if not self._pending_writes and not self._inflight_writes:
             return None
+        s3_key = self.s3_service._resolve_key(file_path)
+        with self._pending_lock:
+            pending = self._pending_writes.get(s3_key)
+            if pending is not None:
+                return pending.data
+            return self._inflight_writes.get(s3_key)
     
     
     
@@ -79,6 +205,70 @@ class DataService:
         return self.s3_service.get_file_size(file_path)
     
     
+    def get_etag(self, file_path: str) -> Optional[str]:
+        """
+        Get the ETag of a file in S3
+        
+        Args:
+            file_path (str): Path to the file
+            
+        Returns:
+            The file's ETag, or None if it is missing or the request failed
+        """
+        return self.s3_service.get_etag(file_path)
+    
+    
+    def read_bytes(self, file_path: str) -> Optional[bytes]:
+        """
+        Read a binary (non-JSON) file from S3
+        
+        Args:
+            file_path (str): Path to the file
+            
+        Returns:
+            File contents, or None if the file is missing or could not be read
+        """
+        return self.s3_service.read_bytes(file_path)
+    
+    
+    def write_bytes(self, file_path: str, body: bytes, content_type: str = 'application/octet-stream') -> bool:
+        """
+        Write a binary (non-JSON) file to S3
+        
+        Args:
+            file_path (str): Path to the file
+            body (bytes): File contents
+            content_type (str): Content-Type to store with the object
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.s3_service.write_bytes(file_path, body, content_type)
+    
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters for the S3 read cache
+        
+        Returns:
+            Dict with cache size, capacity, hits, misses and hit rate
+        """
+        return self.s3_service.get_cache_stats()
+    
+    
+    def iter_files(self, prefix: str = "") -> Iterator[str]:
+        """
+        Lazily yield file keys in S3 with optional prefix
+        
+        Args:
+            prefix (str): Prefix to filter files
+            
+        Returns:
+            Iterator over file keys
+        """
+        return self.s3_service.iter_files(prefix)
+    
+    
     def list_files(self, prefix: str = "") -> Optional[list]:
         """
         List files in S3 with optional prefix
@@ -90,4 +280,21 @@ class DataService:
             List of file keys or None if failed
         """
         return self.s3_service.list_files(prefix)
+
+
+def get_data_service() -> DataService:
+    """
+    Get the shared DataService instance
+    
+    All callers in a process share one DataService (and therefore one S3 client and
+    connection pool). Usable directly or as a FastAPI dependency.
     
+    Returns:
+        DataService: The process-wide instance
+    """
+    global _data_service
+    if _data_service is None:
+        with _data_service_lock:
+            if _data_service is None:
+                _data_service = DataService()
+    return _data_service
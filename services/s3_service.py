@@ -1,57 +1,255 @@
 import boto3
+import gzip
+import io
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 import os
+import threading
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from config import Config
 
 # Load environment variables
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# S3 settings are fixed for the life of the process; resolve them once
+_BUCKET = Config.S3_BUCKET_NAME
+_PREFIX = Config.S3_FOLDER_PREFIX
+_REGION = Config.AWS_REGION
+_ACCESS_KEY_ID = Config.AWS_ACCESS_KEY_ID
+_SECRET_ACCESS_KEY = Config.AWS_SECRET_ACCESS_KEY
+
+# Upper bound on concurrent PUTs issued by bulk_write_json_files
+BULK_WRITE_MAX_WORKERS = 10
+
+# Binary (non-JSON) files live in their own sub-prefix, apart from the data files
+BINARY_FILE_PREFIX = '_binary'
+
+# Bodies at or above this size are sent as parallel multipart uploads
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+# gzip level 1 keeps compression cheap while still shrinking JSON several-fold
+GZIP_COMPRESS_LEVEL = 1
+
+# zlib streams in gzip framing (wbits=31). A used stream can't be reset, so each
+# call copies a pristine, already-initialized template instead of building and
+# configuring a new one; this also skips the pure-Python GzipFile layer behind
+# gzip.compress/gzip.decompress.
+_GZIP_WBITS = 31
+_GZIP_COMPRESSOR = zlib.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+_GZIP_DECOMPRESSOR = zlib.decompressobj(_GZIP_WBITS)
+
+def _gzip_compress(content: bytes) -> bytes:
+    """Compress bytes into a single gzip member."""
+    compressor = _GZIP_COMPRESSOR.copy()
+    return compressor.compress(content) + compressor.flush()
+
+def _gzip_decompress(content: bytes) -> bytes:
+    """
+    Decompress a gzip body, including ones with several concatenated members.
+    
+    _gzip_compress writes a single member, but objects uploaded by other tools may
+    hold more; like gzip.decompress, NUL padding between or after members is skipped.
+    
+    Raises:
+        EOFError: If a member is truncated, as gzip.decompress does
+    """
+    chunks = []
+    while content:
+        decompressor = _GZIP_DECOMPRESSOR.copy()
+        chunks.append(decompressor.decompress(content))
+        chunks.append(decompressor.flush())
+        if not decompressor.eof:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+        content = decompressor.unused_data.lstrip(b'\0')
+    return b''.join(chunks)
+
+# Shared connection pool settings; sized above the default of 10 so concurrent
+# requests and bulk writes don't queue for (or re-handshake) connections
+S3_CLIENT_CONFIG = BotoConfig(
+    max_pool_connections=64,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# One boto3 session and client per process, created on first use
+_SESSION = None
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+# LRU of raw object bodies keyed by S3 key, validated against the object's ETag
+# with a HEAD request. Bodies are re-parsed on every hit so callers can freely
+# mutate what they get back without corrupting the cache.
+JSON_CACHE_MAX_ENTRIES = 64
+_json_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_json_cache_lock = threading.Lock()
+_json_cache_stats = {"hits": 0, "misses": 0}
+
+def _cache_get(s3_key: str, etag: str) -> Optional[bytes]:
+    """Return the cached body for s3_key if it still matches etag."""
+    with _json_cache_lock:
+        entry = _json_cache.get(s3_key)
+        if entry is not None and entry[0] == etag:
+            _json_cache.move_to_end(s3_key)
+            _json_cache_stats["hits"] += 1
+            return entry[1]
+        _json_cache_stats["misses"] += 1
+        return None
+
+def _cache_put(s3_key: str, etag: Optional[str], content: bytes) -> None:
+    """Store a body under its ETag, evicting the least recently used entry."""
+    with _json_cache_lock:
+        if not etag:
+            _json_cache.pop(s3_key, None)
+            return
+        _json_cache[s3_key] = (etag, content)
+        _json_cache.move_to_end(s3_key)
+        while len(_json_cache) > JSON_CACHE_MAX_ENTRIES:
+            _json_cache.popitem(last=False)
+
+def _get_shared_client(access_key_id: Optional[str], secret_access_key: Optional[str], region_name: str):
+    """Return the process-wide S3 client, creating it (and resolving credentials) once."""
+    global _SESSION, _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                if access_key_id and secret_access_key:
+                    _SESSION = boto3.session.Session(
+                        aws_access_key_id=access_key_id,
+                        aws_secret_access_key=secret_access_key,
+                        region_name=region_name
+                    )
+                else:
+                    _SESSION = boto3.session.Session(region_name=region_name)
+                _CLIENT = _SESSION.client('s3', config=S3_CLIENT_CONFIG)
+    return _CLIENT
+
+# orjson parses bytes and serializes straight to UTF-8 bytes; fall back to the
+# stdlib encoder when it isn't installed. Objects are written compact unless
+# S3_PRETTY_JSON is set, since they are only ever read back by the API.
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 if Config.S3_PRETTY_JSON else 0
+
+    def _parse_json(content: bytes) -> Any:
+        return orjson.loads(content)
+
+    def _serialize_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+else:
+    _JSON_DUMP_KWARGS = {'indent': 2} if Config.S3_PRETTY_JSON else {'separators': (',', ':')}
+
+    def _parse_json(content: bytes) -> Any:
+        return json.loads(content)
+
+    def _serialize_json(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, **_JSON_DUMP_KWARGS).encode('utf-8')
+
+@lru_cache(maxsize=256)
+def _resolve_key(folder_prefix: str, file_path: str) -> str:
+    """Map a data file path (e.g. '_data/dataModels' or 'dataModels.json') to its S3 key."""
+    # Ensure file_path doesn't start with '_data/' for S3
+    if file_path.startswith('_data/'):
+        file_path = file_path[6:]  # Remove '_data/' prefix
+    
+    # Add .json extension if not present
+    if not file_path.endswith('.json'):
+        file_path = f"{file_path}.json"
+    
+    # Add folder prefix
+    return f"{folder_prefix}/{file_path}"
+
+def _iter_prefix(node: Any, parts: list) -> Iterator[Any]:
+    """Walk a parsed document along an ijson-style prefix (e.g. ['models', 'item'])."""
+    if not parts:
+        yield node
+        return
+    head, rest = parts[0], parts[1:]
+    if head == 'item':
+        if isinstance(node, list):
+            for element in node:
+                yield from _iter_prefix(element, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _iter_prefix(node[head], rest)
+
 class S3Service:
     """Service class for handling S3 operations"""
     
     def __init__(self):
         self.s3_client = None
-        self.bucket_name = Config.S3_BUCKET_NAME
-        self.folder_prefix = Config.S3_FOLDER_PREFIX
-        self.region_name = Config.AWS_REGION
-        self.access_key_id = Config.AWS_ACCESS_KEY_ID
-        self.secret_access_key = Config.AWS_SECRET_ACCESS_KEY
+        self._transfer_config = None
+        self._list_paginator = None
+        self.bucket_name = _BUCKET
+        self.folder_prefix = _PREFIX
+        self.region_name = _REGION
+        self.access_key_id = _ACCESS_KEY_ID
+        self.secret_access_key = _SECRET_ACCESS_KEY
         
-        # Initialize S3 client
+        # Initialize S3 client; availability is checked here once rather than on every call
         self._initialize_s3_client()
+        if not self.is_available():
+            raise RuntimeError("S3 service is not available. Please check your AWS credentials and S3 configuration.")
     
     def _initialize_s3_client(self):
-        """Initialize the S3 client with credentials"""
+        """
+        Bind the process-wide S3 client
+        
+        The boto3 session, credential resolution and connection pool are set up once
+        per process; later S3Service instances reuse the same client.
+        """
         try:
             # For IRSA (IAM Roles for Service Accounts), we don't need explicit credentials
             # The boto3 client will automatically use the IAM role assigned to the service account
+            self.s3_client = _get_shared_client(self.access_key_id, self.secret_access_key, self.region_name)
             if self.access_key_id and self.secret_access_key:
                 # Use explicit credentials (for local development or non-IRSA environments)
-                self.s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=self.access_key_id,
-                    aws_secret_access_key=self.secret_access_key,
-                    region_name=self.region_name
-                )
                 logger.info("S3 client initialized with explicit credentials")
             else:
                 # Use IAM role (IRSA) or default credentials
-                self.s3_client = boto3.client('s3', region_name=self.region_name)
                 logger.info("S3 client initialized with IAM role (IRSA) or default credentials")
+            
+            self._transfer_config = TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD,
+                multipart_chunksize=MULTIPART_THRESHOLD,
+                max_concurrency=8,
+                use_threads=True
+            )
+            # Built once so the operation model isn't re-resolved on every listing
+            self._list_paginator = self.s3_client.get_paginator('list_objects_v2')
                 
         except NoCredentialsError:
             logger.error("AWS credentials not found - check IRSA configuration or provide explicit credentials")
             self.s3_client = None
         except Exception as e:
-            logger.error(f"Failed to initialize S3 client: {e}")
+            logger.error("Failed to initialize S3 client: %s", e)
             self.s3_client = None
     
+    def _resolve_key(self, file_path: str) -> str:
+        """Get the S3 key for a data file path under this service's folder prefix"""
+        return _resolve_key(self.folder_prefix, file_path)
+    
+    def _resolve_binary_key(self, file_path: str) -> str:
+        """Get the S3 key for a binary file path; unlike data files, no .json is added"""
+        return f"{self.folder_prefix}/{BINARY_FILE_PREFIX}/{file_path}"
+    
     def is_available(self) -> bool:
         """Check if S3 service is available"""
         return self.s3_client is not None and self.bucket_name is not None
@@ -66,49 +264,122 @@ class S3Service:
         Returns:
             Dict containing the JSON data or None if failed
         """
-        if not self.is_available():
-            logger.error("S3 service not available")
-            return None
+        return self.read_json_with_meta(file_path)[0]
+    
+    def read_json_with_meta(self, file_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[int], Optional[str]]:
+        """
+        Read a JSON file from S3 together with its stored size and ETag
         
-        try:
-            # Ensure file_path doesn't start with '_data/' for S3
-            if file_path.startswith('_data/'):
-                file_path = file_path[6:]  # Remove '_data/' prefix
-            
-            # Add .json extension if not present
-            if not file_path.endswith('.json'):
-                file_path = f"{file_path}.json"
+        Args:
+            file_path (str): Path to the JSON file in S3 (e.g., 'data/models.json')
             
-            # Add folder prefix
-            s3_key = f"{self.folder_prefix}/{file_path}"
+        Returns:
+            Tuple of (data, size in bytes, ETag), or (None, None, None) if failed
+        """
+        try:
+            s3_key = self._resolve_key(file_path)
             
-            logger.info(f"Reading JSON file from S3: s3://{self.bucket_name}/{s3_key}")
+            logger.debug("Reading JSON file from S3: s3://%s/%s", self.bucket_name, s3_key)
             
-            response = self.s3_client.get_object(
+            # A HEAD is enough to tell whether the cached body is still current
+            head = self.s3_client.head_object(
                 Bucket=self.bucket_name,
                 Key=s3_key
             )
+            size = head.get('ContentLength')
+            etag = head.get('ETag')
+            content = _cache_get(s3_key, etag)
+            if content is None:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key
+                )
+                size = response.get('ContentLength', size)
+                etag = response.get('ETag', etag)
+                content = response['Body'].read()
+                if response.get('ContentEncoding') == 'gzip':
+                    content = _gzip_decompress(content)
+                _cache_put(s3_key, etag, content)
             
-            # Read and parse JSON content
-            content = response['Body'].read().decode('utf-8')
-            data = json.loads(content)
+            # Parse JSON content (parsed from bytes, no separate decode pass)
+            data = _parse_json(content)
             
-            logger.info(f"Successfully read JSON file from S3: {file_path}")
-            return data
+            logger.debug("Successfully read JSON file from S3: %s", file_path)
+            return data, size, etag
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            if error_code == 'NoSuchKey':
-                logger.error(f"File not found in S3: {file_path}")
+            if error_code in ('NoSuchKey', '404'):
+                logger.error("File not found in S3: %s", file_path)
             else:
-                logger.error(f"S3 error reading {file_path}: {e}")
-            return None
+                logger.error("S3 error reading %s: %s", file_path, e)
+            return None, None, None
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in S3 file {file_path}: {e}")
+            logger.error("Invalid JSON in S3 file %s: %s", file_path, e)
+            return None, None, None
+        except Exception as e:
+            logger.error("Unexpected error reading from S3 %s: %s", file_path, e)
+            return None, None, None
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters for the read_json_file body cache
+        
+        Returns:
+            Dict with cache size, capacity, hits, misses and hit rate
+        """
+        with _json_cache_lock:
+            hits = _json_cache_stats["hits"]
+            misses = _json_cache_stats["misses"]
+            size = len(_json_cache)
+        total = hits + misses
+        return {
+            "entries": size,
+            "max_entries": JSON_CACHE_MAX_ENTRIES,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0
+        }
+    
+    def read_json_items(self, file_path: str, prefix: str) -> Optional[Iterator[Any]]:
+        """
+        Stream the values at a JSON prefix from an S3 file without loading the whole document
+        
+        Args:
+            file_path (str): Path to the JSON file in S3
+            prefix (str): ijson prefix of the values to yield (e.g. 'models.item')
+            
+        Returns:
+            Iterator over the matching values, or None if the file could not be opened
+        """
+        try:
+            s3_key = self._resolve_key(file_path)
+            
+            logger.debug("Streaming JSON items '%s' from S3: s3://%s/%s", prefix, self.bucket_name, s3_key)
+            
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=s3_key
+            )
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == 'NoSuchKey':
+                logger.error("File not found in S3: %s", file_path)
+            else:
+                logger.error("S3 error reading %s: %s", file_path, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error reading from S3 {file_path}: {e}")
+            logger.error("Unexpected error reading from S3 %s: %s", file_path, e)
             return None
+        
+        body = response['Body']
+        if response.get('ContentEncoding') == 'gzip':
+            body = gzip.GzipFile(fileobj=body)
+        
+        if ijson is not None:
+            # The body is parsed incrementally as it is read from the socket
+            return ijson.items(body, prefix, use_float=True)
+        return _iter_prefix(_parse_json(body.read()), prefix.split('.') if prefix else [])
     
     def write_json_file(self, file_path: str, data: Dict[str, Any]) -> bool:
         """
@@ -121,45 +392,156 @@ class S3Service:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.is_available():
-            logger.error("S3 service not available")
-            return False
-        
         try:
-            # Ensure file_path doesn't start with '_data/' for S3
-            if file_path.startswith('_data/'):
-                file_path = file_path[6:]  # Remove '_data/' prefix
+            s3_key = self._resolve_key(file_path)
             
-            # Add .json extension if not present
-            if not file_path.endswith('.json'):
-                file_path = f"{file_path}.json"
+            logger.info("Writing JSON file to S3: s3://%s/%s", self.bucket_name, s3_key)
             
-            # Add folder prefix
-            s3_key = f"{self.folder_prefix}/{file_path}"
+            # Convert data to UTF-8 encoded JSON
+            json_content = _serialize_json(data)
             
-            logger.info(f"Writing JSON file to S3: s3://{self.bucket_name}/{s3_key}")
+            body = json_content
+            extra_args = {'ContentType': 'application/json'}
+            if Config.S3_GZIP_JSON:
+                body = _gzip_compress(json_content)
+                extra_args['ContentEncoding'] = 'gzip'
             
-            # Convert data to JSON string
-            json_content = json.dumps(data, indent=2, ensure_ascii=False)
+            # Upload to S3, splitting large bodies across parallel multipart uploads
+            if len(body) >= MULTIPART_THRESHOLD:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(body),
+                    self.bucket_name,
+                    s3_key,
+                    Config=self._transfer_config,
+                    ExtraArgs=extra_args
+                )
+                # Multipart uploads don't report the final ETag; drop any stale entry
+                _cache_put(s3_key, None, json_content)
+            else:
+                response = self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=body,
+                    **extra_args
+                )
+                _cache_put(s3_key, response.get('ETag'), json_content)
             
-            # Upload to S3
-            self.s3_client.put_object(
+            logger.debug("Successfully wrote JSON file to S3: %s", file_path)
+            return True
+            
+        except ClientError as e:
+            logger.error("S3 error writing %s: %s", file_path, e)
+            return False
+        except Exception as e:
+            logger.error("Unexpected error writing to S3 %s: %s", file_path, e)
+            return False
+    
+    def bulk_write_json_files(self, files: Dict[str, Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Write several JSON files to S3 concurrently
+        
+        Args:
+            files (Dict): Mapping of file path to the data to write
+            
+        Returns:
+            Dict mapping each file path to whether its write succeeded
+        """
+        if not files:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(BULK_WRITE_MAX_WORKERS, len(files))) as executor:
+            results = executor.map(lambda item: self.write_json_file(*item), files.items())
+            return dict(zip(files.keys(), results))
+    
+    def read_bytes(self, file_path: str) -> Optional[bytes]:
+        """
+        Read a binary file from S3 as-is
+        
+        Args:
+            file_path (str): Path to the file under BINARY_FILE_PREFIX
+            
+        Returns:
+            File contents, or None if the file is missing or could not be read
+        """
+        try:
+            s3_key = self._resolve_binary_key(file_path)
+            
+            logger.debug("Reading file from S3: s3://%s/%s", self.bucket_name, s3_key)
+            
+            response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=json_content.encode('utf-8'),
-                ContentType='application/json'
+                Key=s3_key
             )
+            return response['Body'].read()
+            
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in ('NoSuchKey', '404'):
+                logger.debug("File not found in S3: %s", file_path)
+            else:
+                logger.error("S3 error reading %s: %s", file_path, e)
+            return None
+        except Exception as e:
+            logger.error("Unexpected error reading from S3 %s: %s", file_path, e)
+            return None
+    
+    def write_bytes(self, file_path: str, body: bytes, content_type: str = 'application/octet-stream') -> bool:
+        """
+        Write a binary file to S3 as-is
+        
+        Args:
+            file_path (str): Path to the file under BINARY_FILE_PREFIX
+            body (bytes): File contents
+            content_type (str): Content-Type to store with the object
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            s3_key = self._resolve_binary_key(file_path)
+            
+            logger.debug("Writing file to S3: s3://%s/%s", self.bucket_name, s3_key)
             
-            logger.info(f"Successfully wrote JSON file to S3: {file_path}")
+            self.s3_client.upload_fileobj(
+                io.BytesIO(body),
+                self.bucket_name,
+                s3_key,
+                Config=self._transfer_config,
+                ExtraArgs={'ContentType': content_type}
+            )
             return True
             
         except ClientError as e:
-            logger.error(f"S3 error writing {file_path}: {e}")
+            logger.error("S3 error writing %s: %s", file_path, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error writing to S3 {file_path}: {e}")
+            logger.error("Unexpected error writing to S3 %s: %s", file_path, e)
             return False
     
+    def iter_files(self, prefix: str = "") -> Iterator[str]:
+        """
+        Lazily yield file keys in the S3 bucket with optional prefix
+        
+        Pages are fetched only as the caller iterates, so stopping early skips the
+        remaining requests. S3 errors are raised during iteration.
+        
+        Args:
+            prefix (str): Prefix to filter files
+            
+        Returns:
+            Iterator over file keys
+        """
+        # Add folder prefix to the search prefix
+        search_prefix = f"{self.folder_prefix}/{prefix}" if prefix else f"{self.folder_prefix}/"
+        
+        for page in self._list_paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=search_prefix,
+            PaginationConfig={'PageSize': 1000}
+        ):
+            for obj in page.get('Contents', []):
+                yield obj['Key']
+    
     def list_files(self, prefix: str = "") -> Optional[list]:
         """
         List files in S3 bucket with optional prefix
@@ -170,32 +552,20 @@ class S3Service:
         Returns:
             List of file keys or None if failed
         """
-        if not self.is_available():
-            logger.error("S3 service not available")
-            return None
-        
         try:
-            # Add folder prefix to the search prefix
-            search_prefix = f"{self.folder_prefix}/{prefix}" if prefix else f"{self.folder_prefix}/"
-            
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=search_prefix
-            )
+            files = list(self.iter_files(prefix))
             
-            if 'Contents' in response:
-                files = [obj['Key'] for obj in response['Contents']]
-                logger.info(f"Listed {len(files)} files with prefix '{prefix}'")
-                return files
+            if files:
+                logger.info("Listed %s files with prefix '%s'", len(files), prefix)
             else:
-                logger.info(f"No files found with prefix '{prefix}'")
-                return []
+                logger.info("No files found with prefix '%s'", prefix)
+            return files
                 
         except ClientError as e:
-            logger.error(f"S3 error listing files with prefix '{prefix}': {e}")
+            logger.error("S3 error listing files with prefix '%s': %s", prefix, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error listing S3 files: {e}")
+            logger.error("Unexpected error listing S3 files: %s", e)
             return None
     
     def file_exists(self, file_path: str) -> bool:
@@ -208,20 +578,8 @@ class S3Service:
         Returns:
             bool: True if file exists, False otherwise
         """
-        if not self.is_available():
-            return False
-        
         try:
-            # Ensure file_path doesn't start with '_data/' for S3
-            if file_path.startswith('_data/'):
-                file_path = file_path[6:]  # Remove '_data/' prefix
-            
-            # Add .json extension if not present
-            if not file_path.endswith('.json'):
-                file_path = f"{file_path}.json"
-            
-            # Add folder prefix
-            s3_key = f"{self.folder_prefix}/{file_path}"
+            s3_key = self._resolve_key(file_path)
             
             self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
             return True
@@ -229,10 +587,10 @@ class S3Service:
             if e.response['Error']['Code'] == '404':
                 return False
             else:
-                logger.error(f"S3 error checking file existence {file_path}: {e}")
+                logger.error("S3 error checking file existence %s: %s", file_path, e)
                 return False
         except Exception as e:
-            logger.error(f"Unexpected error checking S3 file existence: {e}")
+            logger.error("Unexpected error checking S3 file existence: %s", e)
             return False
     
     def get_file_size(self, file_path: str) -> Optional[int]:
@@ -245,27 +603,40 @@ class S3Service:
         Returns:
             File size in bytes or None if failed
         """
-        if not self.is_available():
-            return None
-        
         try:
-            # Ensure file_path doesn't start with '_data/' for S3
-            if file_path.startswith('_data/'):
-                file_path = file_path[6:]  # Remove '_data/' prefix
+            s3_key = self._resolve_key(file_path)
             
-            # Add .json extension if not present
-            if not file_path.endswith('.json'):
-                file_path = f"{file_path}.json"
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return response['ContentLength']
             
-            # Add folder prefix
-            s3_key = f"{self.folder_prefix}/{file_path}"
+        except ClientError as e:
+            logger.error("S3 error getting file size %s: %s", file_path, e)
+            return None
+        except Exception as e:
+            logger.error("Unexpected error getting S3 file size: %s", e)
+            return None
+    
+    def get_etag(self, file_path: str) -> Optional[str]:
+        """
+        Get the ETag of a file in S3
+        
+        Args:
+            file_path (str): Path to the file in S3
+            
+        Returns:
+            The file's ETag, or None if it is missing or the request failed
+        """
+        try:
+            s3_key = self._resolve_key(file_path)
             
             response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
-            return response['ContentLength']
+            return response.get('ETag')
             
         except ClientError as e:
-            logger.error(f"S3 error getting file size {file_path}: {e}")
+            error_code = e.response['Error']['Code']
+            if error_code not in ('NoSuchKey', '404'):
+                logger.error("S3 error getting ETag %s: %s", file_path, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error getting S3 file size: {e}")
+            logger.error("Unexpected error getting S3 ETag: %s", e)
             return None
@@ -3,51 +3,171 @@ Search service for the data catalog API.
 Provides search functionality across all data types.
 """
 
+import hashlib
+import heapq
 import logging
 import json
 import os
 import re
-from typing import List, Dict, Any, Optional
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
-from .data_service import DataService
+from config import Config
+from .data_service import get_data_service
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 logger = logging.getLogger(__name__)
 
+# Words so common they would match nearly every document; they are ignored as query
+# terms (but still indexed, so partial input such as 'th' or 'wit' finds them)
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'with'
+})
+
+# Runs of letters and digits; punctuation and whitespace separate tokens
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+# Upper bound on cached query-token -> vocabulary-term lookups
+TERM_MATCH_CACHE_SIZE = 1024
+
+# Data files fetched and parsed concurrently while building the index
+INDEX_LOAD_MAX_WORKERS = 8
+
+# Data files at or above this size are streamed item by item; smaller ones are
+# parsed whole, which is faster and reuses DataService's cached bodies
+STREAM_PARSE_THRESHOLD = 16 * 1024 * 1024
+
+# Bump when the index layout or text extraction changes so saved snapshots of the
+# old layout are rebuilt instead of loaded
+INDEX_SNAPSHOT_FORMAT = 5
+
+# Data files to index, by document type. The type names are interned so every
+# entry and postings bucket shares one string object per type
+DATA_FILES = {
+    sys.intern(doc_type): filename
+    for doc_type, filename in {
+        'models': 'dataModels.json',
+        'dataAgreements': 'dataAgreements.json',
+        'domains': 'dataDomains.json',
+        'applications': 'applications.json',
+        'reference': 'reference.json',
+        'toolkit': 'toolkit.json',
+        'policies': 'dataPolicies.json',
+        'lexicon': 'lexicon.json'
+    }.items()
+}
+FILE_TO_TYPE = {filename: doc_type for doc_type, filename in DATA_FILES.items()}
+
+# Key of the document array in each data file
+ARRAY_KEYS = {
+    'models': 'models',
+    'dataAgreements': 'agreements',
+    'domains': 'domains',
+    'applications': 'applications',
+    'reference': 'items',
+    'toolkit': 'toolkit',
+    'policies': 'policies',
+    'lexicon': 'terms'
+}
+
+def _doc_id(item: Dict[str, Any]) -> str:
+    """Get an item's document ID: its id, else shortName, else name."""
+    try:
+        doc_id = item['id']
+    except KeyError:
+        doc_id = item.get('shortName', item.get('name', ''))
+    return doc_id if type(doc_id) is str else str(doc_id)
+
+def _content_digest(item: Dict[str, Any]) -> bytes:
+    """Get a short digest of an item's content that doesn't depend on key order."""
+    if orjson is not None:
+        raw = orjson.dumps(item, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        raw = json.dumps(item, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=8).digest()
+
 class SearchService:
     """Search service for the data catalog."""
     
     def __init__(self):
-        self.index = {}
+        # Documents by type, then by ID: {doc_type: {doc_id: entry}}
+        self.index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Inverted index partitioned by type: token -> {doc_type: {doc_id: occurrences}},
+        # plus each document's distinct words (kept off the entries so they aren't
+        # returned in results)
+        self.postings: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.doc_wordsets: Dict[Tuple[str, str], frozenset] = {}
+        # Content digest of each indexed item, so reindexing can keep unchanged documents
+        self.content_hashes: Dict[Tuple[str, str], bytes] = {}
+        # LRU of query token -> indexed tokens containing it; cleared whenever the
+        # vocabulary gains or loses a token
+        self._term_match_cache: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+        self._term_match_lock = threading.Lock()
+        # Guards the index, postings and stats: updates arrive from request handlers
+        # and background reindexes on different threads while searches read them
+        self._index_lock = threading.RLock()
+        self._vocabulary_version = 0
         self.stats = {
             'total_documents': 0,
             'total_tokens': 0,
             'last_updated': None,
             'documents_by_type': {}
         }
-        self.data_service = DataService()
+        self.data_service = get_data_service()
     
-    def load_data_file(self, filename: str) -> List[Dict[str, Any]]:
-        """Load data from S3."""
+    def iter_data_file(self, filename: str, doc_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the documents of a data file from S3.
+        
+        Files of STREAM_PARSE_THRESHOLD bytes or more are parsed one item at a time,
+        so the whole file is never held in memory alongside the index being built.
+        """
         try:
-            data = self.data_service.read_json_file(filename)
-            if not data:
-                return []
-                
-            # Handle different data structures
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict):
-                # Look for common array keys
-                for key in ['models', 'dataAgreements', 'domains', 'applications', 'reference', 'toolkit', 'policies', 'lexicon', 'agreements']:
-                    if key in data and isinstance(data[key], list):
-                        return data[key]
-                # If no array found, return the dict as a single item
-                return [data]
+            array_key = ARRAY_KEYS[doc_type]
+            size = self.data_service.get_file_size(filename)
+            if size is not None and size >= STREAM_PARSE_THRESHOLD:
+                items = self.data_service.read_json_items(filename, f"{array_key}.item")
             else:
-                return []
+                data = self.data_service.read_json_file(filename)
+                items = data.get(array_key) if isinstance(data, dict) else None
+            if items is None:
+                return
+            for item in items:
+                if isinstance(item, dict):
+                    yield item
         except Exception as e:
             logger.error(f"Error loading {filename} from S3: {e}")
-            return []
+    
+    def _load_documents(self, doc_type: str, filename: str) -> List[Tuple[str, Dict[str, Any], str, bytes]]:
+        """Fetch a data file and get (doc_id, item, searchable_text, content_hash) for each indexable item."""
+        logger.info(f"Indexing {doc_type} from {filename}")
+        documents = []
+        for item in self.iter_data_file(filename, doc_type):
+            # Create a unique ID for the document
+            doc_id = _doc_id(item)
+            if not doc_id:
+                continue
+            
+            # Extract searchable text
+            searchable_text = self.extract_searchable_text(item)
+            if not searchable_text:
+                continue
+            
+            documents.append((doc_id, item, searchable_text, _content_digest(item)))
+        return documents
     
     def extract_searchable_text(self, item: Dict[str, Any]) -> str:
         """Extract searchable text from an item."""
@@ -69,78 +189,254 @@ class SearchService:
         
         return ' '.join(text_parts).lower()
     
-    def build_index(self) -> bool:
-        """Build the search index from all data sources."""
+    def _index_document(self, doc_type: str, doc_id: str, item: Dict[str, Any], searchable_text: str, content_hash: bytes) -> int:
+        """Store a document and add its tokens to the postings. Returns its token count."""
+        index_key = (doc_type, doc_id)
+        tokens = _TOKEN_RE.findall(searchable_text)
+        bucket = self.index.get(doc_type)
+        if bucket is None:
+            bucket = self.index[doc_type] = {}
+        elif doc_id in bucket:
+            # Duplicate ID in the source data: the later item replaces the earlier one
+            self._remove_postings(index_key)
+        bucket[doc_id] = {
+            '_search_type': doc_type,
+            '_search_id': doc_id,
+            '_search_tokens': len(tokens),
+            **item
+        }
+        
+        postings = self.postings
+        for token in tokens:
+            by_type = postings.get(token)
+            if by_type is None:
+                by_type = postings[token] = {}
+                self._vocabulary_changed()
+            doc_counts = by_type.get(doc_type)
+            if doc_counts is None:
+                doc_counts = by_type[doc_type] = {}
+            doc_counts[doc_id] = doc_counts.get(doc_id, 0) + 1
+        self.doc_wordsets[index_key] = frozenset(tokens)
+        self.content_hashes[index_key] = content_hash
+        return len(tokens)
+    
+    def _unindex_document(self, doc_type: str, doc_id: str) -> int:
+        """Remove a document and its postings. Returns the token count it had."""
+        item = self.index.get(doc_type, {}).pop(doc_id, None)
+        if item is None:
+            return 0
+        
+        self._remove_postings((doc_type, doc_id))
+        return item.get('_search_tokens', 0)
+    
+    def _remove_postings(self, index_key: Tuple[str, str]) -> None:
+        """Drop a document from the postings of every token it contained."""
+        doc_type, doc_id = index_key
+        self.content_hashes.pop(index_key, None)
+        for token in self.doc_wordsets.pop(index_key, ()):
+            by_type = self.postings.get(token)
+            if by_type is None:
+                continue
+            doc_counts = by_type.get(doc_type)
+            if doc_counts is not None:
+                doc_counts.pop(doc_id, None)
+                if not doc_counts:
+                    del by_type[doc_type]
+            if not by_type:
+                del self.postings[token]
+                self._vocabulary_changed()
+    
+    def _match_postings(self, query_token: str, doc_types: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+        """
+        Get {(doc_type, doc_id): occurrences} for every indexed token containing query_token.
+        
+        Matching is by substring, like the plain-text search it replaces, so partial
+        words (e.g. 'cust' for 'customer') still find documents. When doc_types is
+        given only those types' postings are read.
+        """
+        matches = {}
+        for token in self._matching_terms(query_token):
+            by_type = self.postings.get(token)
+            if not by_type:
+                continue
+            for doc_type in (doc_types or list(by_type)):
+                doc_counts = by_type.get(doc_type)
+                if not doc_counts:
+                    continue
+                for doc_id, count in doc_counts.items():
+                    index_key = (doc_type, doc_id)
+                    matches[index_key] = matches.get(index_key, 0) + count
+        return matches
+    
+    def _matching_terms(self, query_token: str) -> Tuple[str, ...]:
+        """Get the indexed tokens containing query_token, scanning the vocabulary only on a cache miss."""
+        cache = self._term_match_cache
+        with self._term_match_lock:
+            terms = cache.get(query_token)
+            if terms is not None:
+                cache.move_to_end(query_token)
+                return terms
+        
+        version = self._vocabulary_version
+        terms = tuple(token for token in list(self.postings) if query_token in token)
+        with self._term_match_lock:
+            # Don't cache a scan that raced with an index update
+            if version == self._vocabulary_version:
+                cache[query_token] = terms
+                if len(cache) > TERM_MATCH_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return terms
+    
+    def _vocabulary_changed(self) -> None:
+        """Invalidate cached vocabulary matches after a token is added or removed."""
+        with self._term_match_lock:
+            self._vocabulary_version += 1
+            self._term_match_cache.clear()
+    
+    def build_index(self, use_snapshot: bool = False) -> bool:
+        """
+        Build the search index from all data sources.
+        
+        Args:
+            use_snapshot (bool): Load the saved index from S3 when the data files are
+                unchanged, and save a fresh one otherwise. Only the startup build does this.
+        
+        Returns:
+            bool: True if the index was built or loaded
+        """
         try:
             logger.info("Building search index...")
-            self.index = {}
-            self.stats = {
-                'total_documents': 0,
-                'total_tokens': 0,
-                'last_updated': datetime.now().isoformat(),
-                'documents_by_type': {}
-            }
             
-            # Data files to index
-            data_files = {
-                'models': 'dataModels.json',
-                'dataAgreements': 'dataAgreements.json',
-                'domains': 'dataDomains.json',
-                'applications': 'applications.json',
-                'reference': 'reference.json',
-                'toolkit': 'toolkit.json',
-                'policies': 'dataPolicies.json',
-                'lexicon': 'lexicon.json'
-            }
+            # Reuse the last saved index if none of the data files have changed since
+            source_version = self._source_version() if use_snapshot else None
+            if source_version is not None and self._load_snapshot(source_version):
+                return True
             
-            total_documents = 0
-            total_tokens = 0
+            # Downloading and parsing are I/O bound, so the files are fetched in
+            # parallel, and before taking the lock so searches keep using the old index
+            with ThreadPoolExecutor(max_workers=INDEX_LOAD_MAX_WORKERS) as executor:
+                loaded = list(executor.map(self._load_documents, DATA_FILES, DATA_FILES.values()))
             
-            for doc_type, filename in data_files.items():
-                logger.info(f"Indexing {doc_type} from {filename}")
-                data = self.load_data_file(filename)
-                
-                if not data:
-                    continue
+            with self._index_lock:
+                self.index = {}
+                self.postings = {}
+                self.doc_wordsets = {}
+                self.content_hashes = {}
+                self._vocabulary_changed()
+                self.stats = {
+                    'total_documents': 0,
+                    'total_tokens': 0,
+                    'last_updated': datetime.now().isoformat(),
+                    'documents_by_type': {}
+                }
                 
-                self.stats['documents_by_type'][doc_type] = 0
+                total_documents = 0
+                total_tokens = 0
                 
-                for item in data:
-                    # Create a unique ID for the document
-                    doc_id = str(item.get('id', item.get('shortName', item.get('name', ''))))
-                    if not doc_id:
-                        continue
-                    
-                    # Extract searchable text
-                    searchable_text = self.extract_searchable_text(item)
-                    if not searchable_text:
-                        continue
-                    
-                    # Add to index
-                    index_key = f"{doc_type}:{doc_id}"
-                    self.index[index_key] = {
-                        '_search_type': doc_type,
-                        '_search_id': doc_id,
-                        '_search_text': searchable_text,
-                        **item
-                    }
+                for doc_type, documents in zip(DATA_FILES, loaded):
+                    for doc_id, item, searchable_text, content_hash in documents:
+                        total_tokens += self._index_document(doc_type, doc_id, item, searchable_text, content_hash)
+                    total_documents += len(documents)
+                    self.stats['documents_by_type'][doc_type] = len(documents)
                     
-                    total_documents += 1
-                    total_tokens += len(searchable_text.split())
-                    self.stats['documents_by_type'][doc_type] += 1
+                    logger.info(f"Indexed {len(documents)} {doc_type} documents")
                 
-                logger.info(f"Indexed {self.stats['documents_by_type'][doc_type]} {doc_type} documents")
-            
-            self.stats['total_documents'] = total_documents
-            self.stats['total_tokens'] = total_tokens
+                self.stats['total_documents'] = total_documents
+                self.stats['total_tokens'] = total_tokens
             
             logger.info(f"Search index built successfully with {total_documents} documents")
+            if source_version is not None:
+                self._save_snapshot(source_version)
             return True
             
         except Exception as e:
             logger.error(f"Error building search index: {e}")
             return False
     
+    def _source_version(self) -> Optional[str]:
+        """
+        Get a version string for the current contents of every data file.
+        
+        Built from the files' ETags, so only HEAD requests are needed. Returns None
+        when snapshots are disabled or unavailable.
+        """
+        if msgspec is None or not Config.SEARCH_INDEX_CACHE_FILE:
+            return None
+        
+        with ThreadPoolExecutor(max_workers=INDEX_LOAD_MAX_WORKERS) as executor:
+            etags = list(executor.map(self.data_service.get_etag, DATA_FILES.values()))
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(INDEX_SNAPSHOT_FORMAT).encode())
+        for filename, etag in zip(DATA_FILES.values(), etags):
+            digest.update(f"\0{filename}={etag or ''}".encode())
+        return digest.hexdigest()
+    
+    def _load_snapshot(self, source_version: str) -> bool:
+        """Load the saved index if it was built from source_version. Returns True if loaded."""
+        raw = self.data_service.read_bytes(Config.SEARCH_INDEX_CACHE_FILE)
+        if not raw:
+            return False
+        
+        try:
+            snapshot = msgspec.msgpack.decode(raw)
+            if snapshot.get('version') != source_version:
+                logger.info("Saved search index is out of date; rebuilding")
+                return False
+            
+            index = {sys.intern(doc_type): bucket for doc_type, bucket in snapshot['index'].items()}
+            doc_wordsets = {
+                (doc_type, doc_id): frozenset(words)
+                for doc_type, bucket in snapshot['wordsets'].items()
+                for doc_id, words in bucket.items()
+            }
+            content_hashes = {
+                (doc_type, doc_id): content_hash
+                for doc_type, bucket in snapshot['hashes'].items()
+                for doc_id, content_hash in bucket.items()
+            }
+            stats = snapshot['stats']
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable saved search index: {e}")
+            return False
+        
+        with self._index_lock:
+            self.index = index
+            self.postings = snapshot['postings']
+            self.doc_wordsets = doc_wordsets
+            self.content_hashes = content_hashes
+            self.stats = stats
+            self._vocabulary_changed()
+        
+        logger.info(f"Search index loaded from {Config.SEARCH_INDEX_CACHE_FILE} with {stats['total_documents']} documents")
+        return True
+    
+    def _save_snapshot(self, source_version: str) -> None:
+        """Save the index so later builds from the same data can load it instead."""
+        try:
+            with self._index_lock:
+                wordsets: Dict[str, Dict[str, List[str]]] = {}
+                for (doc_type, doc_id), words in self.doc_wordsets.items():
+                    wordsets.setdefault(doc_type, {})[doc_id] = list(words)
+                hashes: Dict[str, Dict[str, bytes]] = {}
+                for (doc_type, doc_id), content_hash in self.content_hashes.items():
+                    hashes.setdefault(doc_type, {})[doc_id] = content_hash
+                
+                raw = msgspec.msgpack.encode({
+                    'version': source_version,
+                    'index': self.index,
+                    'postings': self.postings,
+                    'wordsets': wordsets,
+                    'hashes': hashes,
+                    'stats': self.stats
+                })
+        except Exception as e:
+            logger.warning(f"Could not serialize search index: {e}")
+            return
+        
+        if self.data_service.write_bytes(Config.SEARCH_INDEX_CACHE_FILE, raw, 'application/msgpack'):
+            logger.info(f"Saved search index to {Config.SEARCH_INDEX_CACHE_FILE} ({len(raw)} bytes)")
+    
     def reindex(self) -> bool:
         """Rebuild the search index from scratch."""
         logger.info("Reindexing search data...")
@@ -151,74 +447,68 @@ class SearchService:
         try:
             logger.info(f"Reindexing file: {filename}")
             
-            # Map filename to doc_type
-            file_to_type = {
-                'dataModels.json': 'models',
-                'dataAgreements.json': 'dataAgreements',
-                'dataDomains.json': 'domains',
-                'applications.json': 'applications',
-                'reference.json': 'reference',
-                'toolkit.json': 'toolkit',
-                'dataPolicies.json': 'policies',
-                'lexicon.json': 'lexicon'
-            }
-            
-            doc_type = file_to_type.get(filename)
+            doc_type = FILE_TO_TYPE.get(filename)
             if not doc_type:
                 logger.warning(f"Unknown file type for reindexing: {filename}")
                 return False
             
-            # Remove existing entries for this file type
-            keys_to_remove = [key for key in self.index.keys() if key.startswith(f"{doc_type}:")]
-            for key in keys_to_remove:
-                del self.index[key]
+            # Fetch before taking the lock so searches aren't held up by S3; a missing
+            # or empty file yields no items
+            items = list(self.iter_data_file(filename, doc_type))
             
-            # Reset count for this type
-            if doc_type in self.stats['documents_by_type']:
-                self.stats['total_documents'] -= self.stats['documents_by_type'][doc_type]
-            self.stats['documents_by_type'][doc_type] = 0
-            
-            # Load and index new data
-            raw_data = self.data_service.read_json_file(filename)
-            if not raw_data:
-                logger.info(f"No data found in {filename}")
-                return True
-            
-            # Extract the array from the data structure
-            data = self.load_data_file(filename)
-            if not data:
-                logger.info(f"No processable data found in {filename}")
-                return True
-            
-            count = 0
-            for item in data:
-                # Create a unique ID for the document
-                doc_id = str(item.get('id', item.get('shortName', item.get('name', ''))))
-                if not doc_id:
-                    continue
+            with self._index_lock:
+                # Take the existing entries out of the index; unchanged ones are put back as-is
+                previous = self.index.pop(doc_type, {})
+                for item in previous.values():
+                    self.stats['total_tokens'] -= item.get('_search_tokens', 0)
                 
-                # Extract searchable text
-                searchable_text = self.extract_searchable_text(item)
-                if not searchable_text:
-                    continue
+                # Reset count for this type
+                if doc_type in self.stats['documents_by_type']:
+                    self.stats['total_documents'] -= self.stats['documents_by_type'][doc_type]
+                self.stats['documents_by_type'][doc_type] = 0
                 
-                # Add to index
-                index_key = f"{doc_type}:{doc_id}"
-                self.index[index_key] = {
-                    '_search_type': doc_type,
-                    '_search_id': doc_id,
-                    '_search_text': searchable_text,
-                    **item
-                }
+                # Index the new data
+                count = 0
+                unchanged = 0
+                for item in items:
+                    # Create a unique ID for the document
+                    doc_id = _doc_id(item)
+                    if not doc_id:
+                        continue
+                    
+                    content_hash = _content_digest(item)
+                    entry = previous.pop(doc_id, None)
+                    if entry is not None:
+                        if self.content_hashes.get((doc_type, doc_id)) == content_hash:
+                            # Same content as when it was indexed: keep the entry and its postings
+                            self.index.setdefault(doc_type, {})[doc_id] = entry
+                            tokens = entry.get('_search_tokens', 0)
+                            unchanged += 1
+                        else:
+                            self._remove_postings((doc_type, doc_id))
+                            entry = None
+                    
+                    if entry is None:
+                        # Extract searchable text
+                        searchable_text = self.extract_searchable_text(item)
+                        if not searchable_text:
+                            continue
+                        
+                        # Add to index
+                        tokens = self._index_document(doc_type, doc_id, item, searchable_text, content_hash)
+                    
+                    count += 1
+                    self.stats['total_documents'] += 1
+                    self.stats['total_tokens'] += tokens
+                    self.stats['documents_by_type'][doc_type] += 1
                 
-                count += 1
-                self.stats['total_documents'] += 1
-                self.stats['total_tokens'] += len(searchable_text.split())
-                self.stats['documents_by_type'][doc_type] += 1
-            
-            self.stats['last_updated'] = datetime.now().isoformat()
-            logger.info(f"Reindexed {count} documents from {filename}")
-            return True
+                # Drop documents that are no longer in the file
+                for doc_id in previous:
+                    self._remove_postings((doc_type, doc_id))
+                
+                self.stats['last_updated'] = datetime.now().isoformat()
+                logger.info(f"Reindexed {count} documents from {filename} ({unchanged} unchanged)")
+                return True
             
         except Exception as e:
             logger.error(f"Error reindexing file {filename}: {e}")
@@ -227,44 +517,57 @@ class SearchService:
     def search(self, query: str, doc_types: Optional[List[str]] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """Search across all indexed documents."""
         try:
-            if not query or not query.strip():
-                return []
-            
-            query_lower = query.lower().strip()
-            results = []
-            
-            # Filter by document types if specified
-            search_items = self.index.items()
-            if doc_types:
-                search_items = [(k, v) for k, v in search_items if v.get('_search_type') in doc_types]
-            
-            for index_key, item in search_items:
-                search_text = item.get('_search_text', '')
+            with self._index_lock:
+                if not query or not query.strip():
+                    return []
                 
-                # Simple text matching
-                if query_lower in search_text:
-                    # Calculate a simple relevance score
-                    score = search_text.count(query_lower) / len(search_text.split()) if search_text else 0
+                query_lower = query.lower().strip()
+                
+                # A document containing the query contains each of its tokens inside one
+                # of its own tokens, so the postings narrow the documents to check
+                candidates = None
+                for token in _TOKEN_RE.findall(query_lower):
+                    if token in STOPWORDS:
+                        continue
+                    matches = self._match_postings(token, doc_types).keys()
+                    candidates = set(matches) if candidates is None else candidates & matches
+                    if not candidates:
+                        return []
+                
+                results = []
+                for doc_type, bucket in self.index.items():
+                    # Filter by document types if specified
+                    if doc_types and doc_type not in doc_types:
+                        continue
                     
+                    for doc_id, item in bucket.items():
+                        if candidates is not None and (doc_type, doc_id) not in candidates:
+                            continue
+                        
+                        # Simple text matching; entries don't keep their text (the
+                        # postings hold the tokens), so it is rebuilt for the candidates
+                        search_text = self.extract_searchable_text(item)
+                        if query_lower not in search_text:
+                            continue
+                        
+                        # Calculate a simple relevance score
+                        score = search_text.count(query_lower) / len(search_text.split())
+                        results.append((score, item, search_text))
+                
+                # Keep the highest-scoring results (ties in index order) without
+                # sorting every match
+                top_results = heapq.nlargest(limit, results, key=lambda x: x[0])
+                
+                hits = []
+                for score, item, search_text in top_results:
                     # Extract matched terms
-                    matched_terms = []
-                    words = query_lower.split()
-                    for word in words:
-                        if word in search_text:
-                            matched_terms.append(word)
-                    
-                    result = {
+                    matched_terms = [word for word in query_lower.split() if word in search_text]
+                    hits.append({
                         **item,
                         '_search_score': score,
                         '_matched_terms': matched_terms
-                    }
-                    results.append(result)
-            
-            # Sort by relevance score (highest first)
-            results.sort(key=lambda x: x.get('_search_score', 0), reverse=True)
-            
-            # Limit results
-            return results[:limit]
+                    })
+                return hits
             
         except Exception as e:
             logger.error(f"Search error: {e}")
@@ -284,24 +587,24 @@ class SearchService:
             searchable_text = self.extract_searchable_text(document)
             if not searchable_text:
                 return False
+            content_hash = _content_digest(document)
             
-            index_key = f"{doc_type}:{doc_id}"
-            self.index[index_key] = {
-                '_search_type': doc_type,
-                '_search_id': doc_id,
-                '_search_text': searchable_text,
-                **document
-            }
-            
-            # Update stats
-            self.stats['total_documents'] += 1
-            self.stats['total_tokens'] += len(searchable_text.split())
-            if doc_type not in self.stats['documents_by_type']:
-                self.stats['documents_by_type'][doc_type] = 0
-            self.stats['documents_by_type'][doc_type] += 1
-            
-            logger.info(f"Added document {doc_type}:{doc_id}")
-            return True
+            with self._index_lock:
+                replaced = doc_id in self.index.get(doc_type, {})
+                if replaced:
+                    # Re-adding replaces the old entry and its postings rather than duplicating them
+                    self.stats['total_tokens'] -= self._unindex_document(doc_type, doc_id)
+                
+                # Update stats
+                self.stats['total_tokens'] += self._index_document(doc_type, doc_id, document, searchable_text, content_hash)
+                if not replaced:
+                    self.stats['total_documents'] += 1
+                    if doc_type not in self.stats['documents_by_type']:
+                        self.stats['documents_by_type'][doc_type] = 0
+                    self.stats['documents_by_type'][doc_type] += 1
+                
+                logger.info(f"Added document {doc_type}:{doc_id}")
+                return True
         except Exception as e:
             logger.error(f"Error adding document: {e}")
             return False
@@ -312,25 +615,16 @@ class SearchService:
             searchable_text = self.extract_searchable_text(document)
             if not searchable_text:
                 return False
+            content_hash = _content_digest(document)
             
-            index_key = f"{doc_type}:{doc_id}"
-            old_item = self.index.get(index_key, {})
-            old_text = old_item.get('_search_text', '')
-            
-            self.index[index_key] = {
-                '_search_type': doc_type,
-                '_search_id': doc_id,
-                '_search_text': searchable_text,
-                **document
-            }
-            
-            # Update token count
-            old_tokens = len(old_text.split()) if old_text else 0
-            new_tokens = len(searchable_text.split())
-            self.stats['total_tokens'] = self.stats['total_tokens'] - old_tokens + new_tokens
-            
-            logger.info(f"Updated document {doc_type}:{doc_id}")
-            return True
+            with self._index_lock:
+                # Each entry records its token count, so the old text needn't be re-split
+                old_tokens = self._unindex_document(doc_type, doc_id)
+                new_tokens = self._index_document(doc_type, doc_id, document, searchable_text, content_hash)
+                self.stats['total_tokens'] = self.stats['total_tokens'] - old_tokens + new_tokens
+                
+                logger.info(f"Updated document {doc_type}:{doc_id}")
+                return True
         except Exception as e:
             logger.error(f"Error updating document: {e}")
             return False
@@ -338,22 +632,20 @@ class SearchService:
     def remove_document(self, doc_type: str, doc_id: str) -> bool:
         """Remove a document from the search index."""
         try:
-            index_key = f"{doc_type}:{doc_id}"
-            if index_key in self.index:
-                item = self.index[index_key]
-                searchable_text = item.get('_search_text', '')
-                
-                del self.index[index_key]
-                
-                # Update stats
-                self.stats['total_documents'] -= 1
-                self.stats['total_tokens'] -= len(searchable_text.split())
-                if doc_type in self.stats['documents_by_type']:
-                    self.stats['documents_by_type'][doc_type] -= 1
-                
-                logger.info(f"Removed document {doc_type}:{doc_id}")
-                return True
-            return False
+            with self._index_lock:
+                item = self.index.get(doc_type, {}).get(doc_id)
+                if item is not None:
+                    removed_tokens = self._unindex_document(doc_type, doc_id)
+                    
+                    # Update stats
+                    self.stats['total_documents'] -= 1
+                    self.stats['total_tokens'] -= removed_tokens
+                    if doc_type in self.stats['documents_by_type']:
+                        self.stats['documents_by_type'][doc_type] -= 1
+                    
+                    logger.info(f"Removed document {doc_type}:{doc_id}")
+                    return True
+                return False
         except Exception as e:
             logger.error(f"Error removing document: {e}")
             return False
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for the gzip helpers in services/s3_service.py.
+"""
+
+import gzip
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from services.s3_service import _gzip_compress, _gzip_decompress
+
+BODY = b'{"models": [{"id": 1, "name": "Customer"}]}' * 100
+
+
+def test_gzip_round_trip():
+    assert _gzip_decompress(_gzip_compress(BODY)) == BODY
+
+
+def test_gzip_decompress_reads_every_member():
+    content = _gzip_compress(BODY) + gzip.compress(b"tail") + b"\0\0"
+    assert _gzip_decompress(content) == BODY + b"tail"
+
+
+def test_gzip_decompress_rejects_truncated_body():
+    content = _gzip_compress(BODY)
+    with pytest.raises(EOFError):
+        _gzip_decompress(content[:-10])
+
+
+def test_gzip_decompress_rejects_truncated_second_member():
+    content = _gzip_compress(BODY) + gzip.compress(b"tail")[:-4]
+    with pytest.raises(EOFError):
+        _gzip_decompress(content)